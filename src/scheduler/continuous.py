@@ -5,15 +5,55 @@ Runs the DailyScheduler on a continuous schedule, executing at configured times
 """
 
 import json
+import logging
 import signal
+import threading
 import time
-from datetime import datetime, date, timedelta
-from typing import Optional, Dict, Set, List, Tuple
-
-import pytz
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta, timezone
+from typing import Any, Optional, Dict, List, Tuple
+from zoneinfo import ZoneInfo
 
 from ..data_feeds import load_settings
 from ..healthcheck import start_health_server, get_health_server
+from .maintenance import is_maintenance_window
+
+logger = logging.getLogger(__name__)
+
+_UTC = timezone.utc
+
+
+@dataclass(frozen=True, slots=True)
+class RunSpec:
+    """A validated scheduled run from settings.yaml `schedule.run_times`."""
+    name: str
+    minute_of_day: int  # UTC minutes past midnight
+    exchanges: Tuple[str, ...]  # Empty = all exchanges
+
+    @classmethod
+    def from_config(cls, run_config: Dict[str, Any]) -> "RunSpec":
+        """Validate and coerce one raw run_times entry."""
+        hour = int(run_config['hour_utc'])
+        minute = int(run_config['minute_utc'])
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(
+                f"Invalid run time {hour:02d}:{minute:02d} UTC for run "
+                f"'{run_config.get('name', 'default')}'"
+            )
+        return cls(
+            name=str(run_config.get('name', 'default')),
+            minute_of_day=hour * 60 + minute,
+            exchanges=tuple(run_config.get('exchanges') or ()),
+        )
+
+    def as_run_config(self) -> Dict[str, Any]:
+        """Dict form expected by DailyScheduler.run_daily()."""
+        return {
+            'name': self.name,
+            'hour_utc': self.minute_of_day // 60,
+            'minute_utc': self.minute_of_day % 60,
+            'exchanges': list(self.exchanges),
+        }
 
 
 class ContinuousScheduler:
@@ -36,113 +76,129 @@ class ContinuousScheduler:
     INIT_RETRY_DELAY_SECONDS = 90  # Give gateway time
     # Max time to wait for gateway to be API-ready
     GATEWAY_READY_TIMEOUT_SECONDS = 600  # 10 minutes total budget
+    # Identical loop errors within this window are logged without a traceback
+    ERROR_REPEAT_SUPPRESS_SECONDS = 1800  # Must exceed the 300s error backoff
 
     def __init__(self):
         self.running = True
+        # Set by the signal handler so blocking waits return immediately
+        self._stop = threading.Event()
         self.scheduler = None  # Will be DailyScheduler instance
-        self.last_run_date: Optional[date] = None
-        self.completed_runs_today: Set[str] = set()
+        # Heavy/circular imports, resolved on first use and reused afterwards
+        self._ib_cls = None
+        self._daily_scheduler_cls = None
+        # (repr, monotonic time) of the last loop error logged with a traceback
+        self._last_loop_error: Tuple[Optional[str], float] = (None, 0.0)
 
         # Load settings for schedule config
         settings = load_settings("config/settings.yaml")
         schedule_config = settings.get('schedule', {})
-        self.timezone = pytz.timezone(schedule_config.get('timezone', 'UTC'))
+        self.timezone = ZoneInfo(schedule_config.get('timezone', 'UTC'))
 
         # Load multiple run times if configured, otherwise use legacy single time
-        self.run_times: List[Dict] = schedule_config.get('run_times', [])
-        if not self.run_times:
+        raw_run_times: List[Dict] = schedule_config.get('run_times', [])
+        if not raw_run_times:
             # Legacy fallback: single run time
-            self.run_times = [{
+            raw_run_times = [{
                 'name': 'daily',
                 'hour_utc': schedule_config.get('run_hour_utc', 6),
                 'minute_utc': schedule_config.get('run_minute_utc', 0),
                 'exchanges': []  # Empty = all exchanges
             }]
+        # Validated once here; the loop only reads RunSpec attributes
+        self.run_times: Tuple[RunSpec, ...] = tuple(
+            RunSpec.from_config(rt) for rt in raw_run_times
+        )
+
+        logger.info(f"Configured run times: {[rt.name for rt in self.run_times]}")
 
-        print(f"Configured run times: {[rt['name'] for rt in self.run_times]}")
+        # Per-run UTC epoch minute at which it next becomes eligible. Starting
+        # at today's slot means runs not yet done today are eligible.
+        day_start = self._epoch_minute(datetime.now(_UTC)) // (24 * 60) * (24 * 60)
+        self._next_eligible: List[int] = [
+            day_start + rt.minute_of_day for rt in self.run_times
+        ]
 
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
 
-    def _signal_handler(self, signum, frame):
-        """Handle shutdown signals gracefully."""
-        print(f"Received signal {signum}, shutting down...")
-        self.running = False
-
-    def _should_run_now(self) -> Tuple[bool, Optional[Dict]]:
+    def _sleep(self, seconds: float) -> bool:
         """
-        Check if it's time to run a scheduled job.
+        Block for up to `seconds`, returning True early if shutdown was requested.
+
+        This is the scheduler's only sleep primitive. Event.wait blocks in a
+        single timed lock acquire; SIGTERM/SIGINT interrupt it, the handler sets
+        the event and the wait returns immediately, so no polling is needed.
 
         Returns:
-            Tuple of (should_run: bool, run_config: dict or None)
-            run_config contains 'name', 'hour_utc', 'minute_utc', 'exchanges'
+            True if shutdown was requested, False if the timeout elapsed
         """
-        now = datetime.now(pytz.UTC)
-        today = now.date()
-
-        # Reset completed runs on new day
-        if self.last_run_date != today:
-            self.completed_runs_today = set()
-            self.last_run_date = today
-
-        # Check each configured run time
-        for run_config in self.run_times:
-            run_name = run_config.get('name', 'default')
-
-            # Skip if already completed this run today
-            if run_name in self.completed_runs_today:
-                continue
+        return self._stop.wait(timeout=seconds)
 
-            scheduled_time = now.replace(
-                hour=run_config['hour_utc'],
-                minute=run_config['minute_utc'],
-                second=0,
-                microsecond=0
-            )
+    def _signal_handler(self, signum, frame):
+        """Handle shutdown signals gracefully."""
+        logger.info(f"Received signal {signum}, shutting down...")
+        self.running = False
+        self._stop.set()
 
-            if now >= scheduled_time:
-                return (True, run_config)
+    @staticmethod
+    def _format_utc(now: datetime) -> str:
+        """'YYYY-MM-DD HH:MM:SS' for a UTC datetime, without strftime."""
+        return now.replace(microsecond=0, tzinfo=None).isoformat(sep=' ')
 
-        return (False, None)
+    @staticmethod
+    def _epoch_minute(now: datetime) -> int:
+        """Whole minutes since the Unix epoch for an aware datetime."""
+        return int(now.timestamp()) // 60
 
-    def _seconds_until_next_run(self) -> int:
+    def _next_action(self, now: datetime) -> Tuple[Optional[int], int]:
         """
-        Calculate seconds until next scheduled run.
+        Decide what the main loop should do, in a single pass over run times.
 
-        Considers all configured run times and finds the soonest one
-        that hasn't been completed today.
-        """
-        now = datetime.now(pytz.UTC)
-
-        candidates = []
-
-        for run_config in self.run_times:
-            run_name = run_config.get('name', 'default')
-
-            # Create scheduled time for today
-            scheduled_time = now.replace(
-                hour=run_config['hour_utc'],
-                minute=run_config['minute_utc'],
-                second=0,
-                microsecond=0
-            )
-
-            # If this run is already completed today or past, schedule for tomorrow
-            if run_name in self.completed_runs_today or now >= scheduled_time:
-                scheduled_time += timedelta(days=1)
-
-            candidates.append(scheduled_time)
+        Args:
+            now: Current UTC time, sampled once per loop iteration
 
-        # Find the soonest scheduled time
-        if candidates:
-            next_run = min(candidates)
-        else:
+        Returns:
+            Tuple of (run_index: int or None, sleep_seconds: int)
+            run_index points into self.run_times at the first configured run
+            whose slot today has passed and which has not run since.
+            sleep_seconds is the delay until the soonest run that is neither
+            completed nor due today (minimum 60 seconds).
+        """
+        current_minutes = now.hour * 60 + now.minute
+        day_start = self._epoch_minute(now) - current_minutes
+        due_index: Optional[int] = None
+        next_offset = None  # minutes from the start of the current minute
+
+        for i, run_spec in enumerate(self.run_times):
+            minute_of_day = run_spec.minute_of_day
+            offset = minute_of_day - current_minutes
+            # Eligibility beyond today's slot means it already ran today
+            completed = self._next_eligible[i] > day_start + minute_of_day
+
+            if offset <= 0 or completed:
+                if due_index is None and not completed:
+                    due_index = i
+                # Already completed today or past, next occurrence is tomorrow
+                offset += 24 * 60
+
+            if next_offset is None or offset < next_offset:
+                next_offset = offset
+
+        if next_offset is None:
             # Fallback: tomorrow at 6:00 UTC
-            next_run = now.replace(hour=6, minute=0, second=0, microsecond=0) + timedelta(days=1)
+            next_offset = 6 * 60 - current_minutes + 24 * 60
 
-        delta = next_run - now
-        return max(int(delta.total_seconds()), 60)  # Minimum 60 seconds
+        return (due_index, max(next_offset * 60 - now.second, 60))  # Minimum 60 seconds
+
+    def _mark_completed(self, run_index: int, now: datetime) -> None:
+        """Make a run ineligible until its slot tomorrow."""
+        current_minutes = now.hour * 60 + now.minute
+        day_start = self._epoch_minute(now) - current_minutes
+        self._next_eligible[run_index] = (
+            day_start + self.run_times[run_index].minute_of_day + 24 * 60
+        )
 
     def _wait_for_ib_gateway(self) -> bool:
         """
@@ -151,18 +207,28 @@ class ContinuousScheduler:
         Returns:
             True if gateway appears ready, False if interrupted
         """
-        print(f"Waiting {self.STARTUP_DELAY_SECONDS}s for IB Gateway to be ready...")
+        logger.info(f"Waiting {self.STARTUP_DELAY_SECONDS}s for IB Gateway to be ready...")
 
-        # Wait in small increments to allow for graceful shutdown
-        remaining = self.STARTUP_DELAY_SECONDS
-        while remaining > 0 and self.running:
-            time.sleep(min(10, remaining))
-            remaining -= 10
-            if remaining > 0:
-                print(f"  ...{remaining}s remaining")
+        # Blocks until the delay elapses or a shutdown signal arrives
+        if self._sleep(self.STARTUP_DELAY_SECONDS):
+            return False
 
         return self.running
 
+    def _get_ib_cls(self):
+        """Resolve ib_insync.IB once (kept out of module import time)."""
+        if self._ib_cls is None:
+            from ib_insync import IB
+            self._ib_cls = IB
+        return self._ib_cls
+
+    def _get_daily_scheduler_cls(self):
+        """Resolve DailyScheduler once (imported lazily to avoid circular imports)."""
+        if self._daily_scheduler_cls is None:
+            from ..scheduler_main import DailyScheduler
+            self._daily_scheduler_cls = DailyScheduler
+        return self._daily_scheduler_cls
+
     def _check_gateway_api_ready(self, host: str = "ibgateway", port: int = 4000) -> bool:
         """
         Check if IB Gateway is truly API-ready (not just accepting connections).
@@ -175,8 +241,7 @@ class ContinuousScheduler:
             True if gateway API is responding, False otherwise
         """
         try:
-            from ib_insync import IB
-            ib = IB()
+            ib = self._get_ib_cls()()
             # Use a short timeout and test client ID
             ib.connect(host=host, port=port, clientId=99, timeout=15, readonly=True)
             if ib.isConnected():
@@ -184,12 +249,12 @@ class ContinuousScheduler:
                 accounts = ib.managedAccounts()
                 ib.disconnect()
                 if accounts:
-                    print(f"  Gateway API ready - accounts: {accounts}")
+                    logger.info(f"  Gateway API ready - accounts: {accounts}")
                     return True
             ib.disconnect()
             return False
         except Exception as e:
-            print(f"  Gateway API not ready: {e}")
+            logger.debug("  Gateway API not ready: %s", e)
             return False
 
     def _wait_for_gateway_api_ready(self, host: str = "ibgateway", port: int = 4000) -> bool:
@@ -199,7 +264,7 @@ class ContinuousScheduler:
         Returns:
             True if gateway becomes API-ready, False if timeout or interrupted
         """
-        print(f"Checking if IB Gateway API is ready (timeout: {self.GATEWAY_READY_TIMEOUT_SECONDS}s)...")
+        logger.info(f"Checking if IB Gateway API is ready (timeout: {self.GATEWAY_READY_TIMEOUT_SECONDS}s)...")
 
         start_time = time.time()
         check_interval = 30  # Check every 30 seconds
@@ -207,21 +272,30 @@ class ContinuousScheduler:
         while self.running:
             elapsed = time.time() - start_time
             if elapsed >= self.GATEWAY_READY_TIMEOUT_SECONDS:
-                print(f"  Timeout waiting for gateway API after {elapsed:.0f}s")
+                logger.warning(f"  Timeout waiting for gateway API after {elapsed:.0f}s")
                 return False
 
+            # Don't spend handshakes on a gateway that is known to be down
+            in_maintenance, window_name, minutes_remaining = is_maintenance_window()
+            if in_maintenance:
+                remaining = self.GATEWAY_READY_TIMEOUT_SECONDS - elapsed
+                logger.info(f"  IBKR maintenance window '{window_name}' active, "
+                            f"pausing probes for {minutes_remaining} min")
+                if self._sleep(min(minutes_remaining * 60, remaining)):
+                    break
+                continue
+
             if self._check_gateway_api_ready(host, port):
-                print(f"  Gateway API ready after {elapsed:.0f}s")
+                logger.info(f"  Gateway API ready after {elapsed:.0f}s")
                 return True
 
             remaining = self.GATEWAY_READY_TIMEOUT_SECONDS - elapsed
-            print(f"  Gateway not ready, retrying in {check_interval}s ({remaining:.0f}s remaining)...")
+            logger.debug("  Gateway not ready, retrying in %ss (%.0fs remaining)...",
+                         check_interval, remaining)
 
-            # Wait before next check
-            wait_remaining = check_interval
-            while wait_remaining > 0 and self.running:
-                time.sleep(min(5, wait_remaining))
-                wait_remaining -= 5
+            # Wait before next check (returns early on shutdown)
+            if self._sleep(check_interval):
+                break
 
         return False
 
@@ -240,17 +314,16 @@ class ContinuousScheduler:
         Returns:
             True if successful, False otherwise
         """
-        # Import here to avoid circular imports
-        from ..scheduler_main import DailyScheduler
+        DailyScheduler = self._get_daily_scheduler_cls()
 
         # First, wait for gateway API to be ready before any init attempts
         if not self._wait_for_gateway_api_ready():
-            print("Gateway API not ready after timeout, skipping this run")
+            logger.warning("Gateway API not ready after timeout, skipping this run")
             get_health_server().update_ib_status(False)
             return False
 
         for attempt in range(1, self.MAX_INIT_RETRIES + 1):
-            print(f"Initialization attempt {attempt}/{self.MAX_INIT_RETRIES}")
+            logger.info(f"Initialization attempt {attempt}/{self.MAX_INIT_RETRIES}")
 
             # Create new scheduler instance for each attempt
             self.scheduler = DailyScheduler()
@@ -264,25 +337,28 @@ class ContinuousScheduler:
                     result = self.scheduler.run_daily(run_config=run_config)
 
                     run_name = run_config.get('name', 'daily') if run_config else 'daily'
-                    print(f"Run '{run_name}' completed: {json.dumps(result, indent=2)}")
+                    # Only serialise the result if the line will actually be emitted;
+                    # pretty-print at DEBUG, compact otherwise
+                    if logger.isEnabledFor(logging.INFO):
+                        if logger.isEnabledFor(logging.DEBUG):
+                            result_json = json.dumps(result, indent=2)
+                        else:
+                            result_json = json.dumps(result, separators=(",", ":"))
+                        logger.info("Run '%s' completed: %s", run_name, result_json)
                     return True
                 else:
                     get_health_server().update_ib_status(False)
-                    print(f"Initialization failed on attempt {attempt}")
+                    logger.warning(f"Initialization failed on attempt {attempt}")
                     if attempt < self.MAX_INIT_RETRIES:
-                        print(f"Retrying in {self.INIT_RETRY_DELAY_SECONDS}s...")
-                        # Wait before retry
-                        remaining = self.INIT_RETRY_DELAY_SECONDS
-                        while remaining > 0 and self.running:
-                            time.sleep(min(10, remaining))
-                            remaining -= 10
-                        if not self.running:
+                        logger.info(f"Retrying in {self.INIT_RETRY_DELAY_SECONDS}s...")
+                        # Wait before retry (returns early on shutdown)
+                        if self._sleep(self.INIT_RETRY_DELAY_SECONDS):
                             return False
             finally:
                 self.scheduler.shutdown()
                 self.scheduler = None
 
-        print(f"Failed to initialize after {self.MAX_INIT_RETRIES} attempts")
+        logger.error(f"Failed to initialize after {self.MAX_INIT_RETRIES} attempts")
         return False
 
     def run(self):
@@ -294,72 +370,102 @@ class ContinuousScheduler:
         except ImportError:
             METRICS_AVAILABLE = False
 
-        print(f"ContinuousScheduler started")
-        print(f"Configured run times:")
+        logger.info("ContinuousScheduler started")
+        logger.info("Configured run times:")
         for rt in self.run_times:
-            print(f"  - {rt['name']}: {rt['hour_utc']:02d}:{rt['minute_utc']:02d} UTC "
-                  f"(exchanges: {rt.get('exchanges', 'all')})")
-        print(f"Current time: {datetime.now(pytz.UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC")
+            logger.info(f"  - {rt.name}: {rt.minute_of_day // 60:02d}:{rt.minute_of_day % 60:02d} UTC "
+                        f"(exchanges: {list(rt.exchanges) or 'all'})")
+        logger.info(f"Current time: {self._format_utc(datetime.now(_UTC))} UTC")
 
         # Start health check server for external monitoring
         health_server = start_health_server(port=8080)
-        print("Health check server running on port 8080")
+        logger.info("Health check server running on port 8080")
 
         # Start Prometheus metrics server
         if METRICS_AVAILABLE:
             start_metrics_server(port=8000)
-            print("Prometheus metrics server running on port 8000")
+            logger.info("Prometheus metrics server running on port 8000")
 
         # Wait for IB Gateway to be ready on startup
         if not self._wait_for_ib_gateway():
-            print("Startup interrupted")
+            logger.info("Startup interrupted")
             health_server.stop()
             return
 
         while self.running:
             try:
-                should_run, run_config = self._should_run_now()
-                if should_run and run_config:
-                    run_name = run_config.get('name', 'default')
-                    print(f"\n{'='*60}")
-                    print(f"Starting run '{run_name}' at {datetime.now(pytz.UTC).isoformat()}")
-                    print(f"Target exchanges: {run_config.get('exchanges', 'all')}")
-                    print(f"{'='*60}\n")
-
-                    success = self._run_daily_with_retries(run_config)
-
-                    # Mark this run as completed
-                    self.completed_runs_today.add(run_name)
+                now = datetime.now(_UTC)
+                run_index, sleep_seconds = self._next_action(now)
+
+                # Nothing can succeed during IBKR maintenance: hold due runs and
+                # sleep through the window rather than probing the gateway
+                in_maintenance, window_name, minutes_remaining = is_maintenance_window(now)
+                if in_maintenance:
+                    window_end_seconds = max(minutes_remaining * 60 - now.second, 1)
+                    if run_index is not None:
+                        logger.info(
+                            f"Run '{self.run_times[run_index].name}' deferred: "
+                            f"IBKR maintenance window '{window_name}' active for {minutes_remaining} more min"
+                        )
+                        run_index = None
+                        sleep_seconds = window_end_seconds
+                    else:
+                        sleep_seconds = max(sleep_seconds, window_end_seconds)
+
+                if run_index is not None:
+                    run_spec = self.run_times[run_index]
+                    run_name = run_spec.name
+                    logger.info("=" * 60)
+                    logger.info(f"Starting run '{run_name}' at {now.isoformat()}")
+                    logger.info(f"Target exchanges: {list(run_spec.exchanges) or 'all'}")
+                    logger.info("=" * 60)
+
+                    success = self._run_daily_with_retries(run_spec.as_run_config())
+
+                    # Mark this run as completed (against the start-of-run clock)
+                    self._mark_completed(run_index, now)
+
+                    # The run can take minutes; re-sample once for everything after it
+                    now = datetime.now(_UTC)
+                    finished_iso = now.isoformat()
 
                     # Update health server with run result
                     health_server.update_daily_run({
-                        "timestamp": datetime.now(pytz.UTC).isoformat(),
+                        "timestamp": finished_iso,
                         "success": success,
                         "date": date.today().isoformat(),
                         "run_name": run_name
                     })
 
-                    print(f"\n{'='*60}")
-                    print(f"Run '{run_name}' finished at {datetime.now(pytz.UTC).isoformat()}")
-                    print(f"{'='*60}\n")
+                    logger.info("=" * 60)
+                    logger.info(f"Run '{run_name}' finished at {finished_iso}")
+                    logger.info("=" * 60)
 
-                # Calculate sleep time
-                sleep_seconds = self._seconds_until_next_run()
-                next_run_time = datetime.now(pytz.UTC) + timedelta(seconds=sleep_seconds)
-                print(f"Next run scheduled for: {next_run_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-                print(f"Sleeping for {sleep_seconds} seconds ({sleep_seconds/3600:.1f} hours)...")
+                    # Sleep time must reflect the run just completed
+                    _, sleep_seconds = self._next_action(now)
 
-                # Sleep in small increments to allow for graceful shutdown
-                sleep_increment = 60  # Check every minute
-                while sleep_seconds > 0 and self.running:
-                    time.sleep(min(sleep_increment, sleep_seconds))
-                    sleep_seconds -= sleep_increment
+                if logger.isEnabledFor(logging.DEBUG):
+                    next_run_time = now + timedelta(seconds=sleep_seconds)
+                    logger.debug("Next run scheduled for: %s UTC", self._format_utc(next_run_time))
+                    logger.debug("Sleeping for %s seconds (%.1f hours)...",
+                                 sleep_seconds, sleep_seconds / 3600)
+
+                # Single interruptible wait; a shutdown signal wakes it immediately
+                if self._sleep(sleep_seconds):
+                    break
 
             except Exception as e:
-                print(f"Error in scheduler loop: {e}")
-                import traceback
-                traceback.print_exc()
+                # Full traceback only for a new error; repeats within the
+                # suppression window get a one-line warning
+                error_key = repr(e)
+                now_mono = time.monotonic()
+                last_key, last_at = self._last_loop_error
+                if error_key == last_key and now_mono - last_at < self.ERROR_REPEAT_SUPPRESS_SECONDS:
+                    logger.warning("Error in scheduler loop (repeated): %s", error_key)
+                else:
+                    logger.exception("Error in scheduler loop: %s", e)
+                    self._last_loop_error = (error_key, now_mono)
                 # Wait a bit before retrying
-                time.sleep(300)  # 5 minutes
+                self._sleep(300)  # 5 minutes
 
-        print("ContinuousScheduler stopped")
+        logger.info("ContinuousScheduler stopped")
@@ -4,9 +4,12 @@ IBKR Maintenance Window Detection.
 Provides utilities to detect when IBKR may be unstable due to scheduled maintenance.
 """
 
-from datetime import datetime
+from bisect import bisect_right
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional, Tuple, List, Dict
-import pytz
+
+_UTC = timezone.utc
 
 
 # =============================================================================
@@ -39,6 +42,36 @@ IBKR_MAINTENANCE_WINDOWS: List[Dict] = [
     },
 ]
 
+# Windows compiled to minute-of-day integers at import time:
+# (name, days, start_minutes, end_minutes, duration_minutes, overnight)
+# For overnight windows end_minutes is the minute-of-day on the following day,
+# so the duration adds back the 24h that end_minutes wrapped past.
+_COMPILED_WINDOWS: Tuple[Tuple[str, frozenset, int, int, int, bool], ...] = tuple(
+    (name, days, start, end, end + (24 * 60 if overnight else 0) - start, overnight)
+    for name, days, start, end, overnight in (
+        (
+            w["name"],
+            frozenset(w["days"]),
+            w["start_hour"] * 60 + w["start_minute"],
+            (w["end_hour"] % 24) * 60 + w["end_minute"],
+            w["end_hour"] >= 24,
+        )
+        for w in IBKR_MAINTENANCE_WINDOWS
+    )
+)
+
+_MINUTES_PER_DAY = 24 * 60
+_MINUTES_PER_WEEK = 7 * _MINUTES_PER_DAY
+
+# Every window start in the week, sorted: (minute_in_week, name, duration_minutes).
+# Minute 0 is Monday 00:00 UTC, matching datetime.weekday().
+_WEEKLY_SCHEDULE: Tuple[Tuple[int, str, int], ...] = tuple(sorted(
+    (day * _MINUTES_PER_DAY + start_minutes, name, duration)
+    for name, days, start_minutes, _, duration, _ in _COMPILED_WINDOWS
+    for day in days
+))
+_WEEKLY_STARTS: Tuple[int, ...] = tuple(entry[0] for entry in _WEEKLY_SCHEDULE)
+
 
 def is_maintenance_window(now: Optional[datetime] = None) -> Tuple[bool, Optional[str], int]:
     """
@@ -51,33 +84,35 @@ def is_maintenance_window(now: Optional[datetime] = None) -> Tuple[bool, Optiona
         Tuple of (is_maintenance: bool, window_name: str or None, minutes_remaining: int)
     """
     if now is None:
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(_UTC)
 
-    current_day = now.weekday()
-    current_minutes = now.hour * 60 + now.minute
+    return _is_maintenance_window_cached(now.weekday(), now.hour * 60 + now.minute)
 
-    for window in IBKR_MAINTENANCE_WINDOWS:
-        if current_day not in window["days"]:
-            continue
 
-        start_minutes = window["start_hour"] * 60 + window["start_minute"]
+# Windows are static config, so results only depend on (weekday, minute-of-day)
+@lru_cache(maxsize=7 * 24 * 60)
+def _is_maintenance_window_cached(
+    current_day: int, current_minutes: int
+) -> Tuple[bool, Optional[str], int]:
+    """Minute-granularity core of is_maintenance_window."""
+    for name, days, start_minutes, end_minutes, _, overnight in _COMPILED_WINDOWS:
+        if current_day not in days:
+            continue
 
         # Handle overnight windows (end_hour >= 24)
-        if window["end_hour"] >= 24:
-            end_minutes = (window["end_hour"] - 24) * 60 + window["end_minute"]
+        if overnight:
             # Check if we're in the first part (before midnight) or second part (after midnight)
             if current_minutes >= start_minutes:
                 # We're before midnight, in maintenance
                 remaining = (24 * 60 - current_minutes) + end_minutes
-                return (True, window["name"], remaining)
+                return (True, name, remaining)
             elif current_day == 0 and current_minutes < end_minutes:
                 # Monday morning, check if we're still in Sunday's window
-                return (True, window["name"], end_minutes - current_minutes)
+                return (True, name, end_minutes - current_minutes)
         else:
-            end_minutes = window["end_hour"] * 60 + window["end_minute"]
             if start_minutes <= current_minutes < end_minutes:
                 remaining = end_minutes - current_minutes
-                return (True, window["name"], remaining)
+                return (True, name, remaining)
 
     return (False, None, 0)
 
@@ -93,46 +128,24 @@ def get_next_maintenance_window(now: Optional[datetime] = None) -> Optional[Dict
         Dict with 'name', 'starts_in_minutes', 'duration_minutes' or None if none within 24h
     """
     if now is None:
-        now = datetime.now(pytz.UTC)
-
-    current_day = now.weekday()
-    current_minutes = now.hour * 60 + now.minute
-
-    candidates = []
-
-    for window in IBKR_MAINTENANCE_WINDOWS:
-        start_minutes = window["start_hour"] * 60 + window["start_minute"]
-
-        # Check today's windows
-        if current_day in window["days"]:
-            if current_minutes < start_minutes:
-                # Window is later today
-                candidates.append({
-                    "name": window["name"],
-                    "starts_in_minutes": start_minutes - current_minutes,
-                    "duration_minutes": _window_duration(window),
-                })
-
-        # Check tomorrow's windows
-        tomorrow = (current_day + 1) % 7
-        if tomorrow in window["days"]:
-            minutes_until = (24 * 60 - current_minutes) + start_minutes
-            if minutes_until <= 24 * 60:  # Within 24 hours
-                candidates.append({
-                    "name": window["name"],
-                    "starts_in_minutes": minutes_until,
-                    "duration_minutes": _window_duration(window),
-                })
-
-    if candidates:
-        return min(candidates, key=lambda x: x["starts_in_minutes"])
-    return None
-
-
-def _window_duration(window: Dict) -> int:
-    """Calculate duration of a maintenance window in minutes."""
-    start = window["start_hour"] * 60 + window["start_minute"]
-    end = window["end_hour"] * 60 + window["end_minute"]
-    if window["end_hour"] >= 24:
-        end = (window["end_hour"] - 24) * 60 + window["end_minute"] + 24 * 60
-    return end - start
+        now = datetime.now(_UTC)
+
+    if not _WEEKLY_SCHEDULE:
+        return None
+
+    minute_in_week = now.weekday() * _MINUTES_PER_DAY + now.hour * 60 + now.minute
+
+    # First window starting strictly after the current minute, wrapping the week
+    i = bisect_right(_WEEKLY_STARTS, minute_in_week)
+    if i == len(_WEEKLY_STARTS):
+        i = 0
+    start, name, duration = _WEEKLY_SCHEDULE[i]
+    starts_in = (start - minute_in_week) % _MINUTES_PER_WEEK
+
+    if starts_in > _MINUTES_PER_DAY:  # Only report windows within 24 hours
+        return None
+    return {
+        "name": name,
+        "starts_in_minutes": starts_in,
+        "duration_minutes": duration,
+    }
@@ -2071,7 +2071,14 @@ def main():
         finally:
             scheduler.shutdown()
     else:
-        # Continuous mode (for Docker)
+        # Continuous mode (for Docker). Route ContinuousScheduler's log records
+        # to stdout in the same plain format setup_logging() uses later.
+        import logging
+        logging.basicConfig(
+            format="%(message)s",
+            level=logging.INFO,
+            handlers=[logging.StreamHandler(sys.stdout)]
+        )
         continuous = ContinuousScheduler()
         continuous.run()
 
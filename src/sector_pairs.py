@@ -15,29 +15,63 @@ isolate the regional component.
 
 import logging
 from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence, Tuple
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
-class Sector(Enum):
-    """Sector classifications matching GICS."""
-    FINANCIALS = "financials"
-    TECHNOLOGY = "technology"
-    INDUSTRIALS = "industrials"
-    HEALTHCARE = "healthcare"
-    CONSUMER_DISCRETIONARY = "consumer_discretionary"
-    CONSUMER_STAPLES = "consumer_staples"
-    ENERGY = "energy"
-    MATERIALS = "materials"
-    UTILITIES = "utilities"
-    REAL_ESTATE = "real_estate"
-    COMMUNICATION = "communication"
+class Sector(IntEnum):
+    """
+    Sector classifications matching GICS.
+
+    Integer-valued so Sector-keyed dict lookups and comparisons use int
+    hashing; the GICS-style string name is available as ``sector_str``.
+    """
+    FINANCIALS = 1
+    TECHNOLOGY = 2
+    INDUSTRIALS = 3
+    HEALTHCARE = 4
+    CONSUMER_DISCRETIONARY = 5
+    CONSUMER_STAPLES = 6
+    ENERGY = 7
+    MATERIALS = 8
+    UTILITIES = 9
+    REAL_ESTATE = 10
+    COMMUNICATION = 11
+
+    @property
+    def sector_str(self) -> str:
+        """Lower-case sector name, e.g. "technology"."""
+        return _SECTOR_STR[self]
+
+    @classmethod
+    def from_str(cls, name: str) -> "Sector":
+        """
+        Look up a sector by its string name (case-insensitive).
+
+        Args:
+            name: Sector name, e.g. "technology"
+
+        Returns:
+            Matching Sector
+
+        Raises:
+            ValueError: If the name is not a known sector
+        """
+        try:
+            return cls[name.upper()]
+        except KeyError:
+            raise ValueError(f"{name!r} is not a valid Sector") from None
+
 
+_SECTOR_STR: Dict[Sector, str] = {s: s.name.lower() for s in Sector}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SectorPair:
     """A matched US vs EU sector pair."""
     sector: Sector
@@ -64,7 +98,7 @@ class SectorPair:
     eu_avg_daily_volume: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SectorPairPosition:
     """Target position for a sector pair."""
     pair: SectorPair
@@ -81,6 +115,16 @@ class SectorPairPosition:
     net_value_exposure: float
 
 
+@dataclass(slots=True)
+class PositionsFlat:
+    """Sector pair positions as parallel float64 arrays, one entry per position."""
+    us_notional: np.ndarray
+    eu_notional: np.ndarray
+    us_beta: np.ndarray
+    eu_beta: np.ndarray
+    sectors: Tuple[Sector, ...]
+
+
 # Predefined sector pairs with estimated parameters
 # These should be calibrated periodically with actual data
 #
@@ -197,6 +241,34 @@ SECTOR_PAIRS = {
 }
 
 
+# Default SectorPairEngine config, shared (read-only) by engines built without overrides
+_DEFAULT_CONFIG: Mapping = MappingProxyType({
+    # Sector selection
+    # NOTE: Only Technology and Healthcare have UCITS equivalents for US sector ETFs
+    # Financials (XLF) and Industrials (XLI) are blocked by PRIIPs for EU investors
+    "included_sectors": (
+        Sector.TECHNOLOGY,   # IUIT (US) vs EXV3 (EU) - 10% of sleeve
+        Sector.HEALTHCARE,   # IUHC (US) vs EXV4 (EU) - 10% of sleeve
+    ),
+
+    # Position sizing
+    "equal_weight_sectors": True,
+    "beta_adjust": True,
+
+    # Factor neutralization
+    "neutralize_growth_value": True,
+    "max_growth_exposure": 0.1,
+    "max_value_exposure": 0.1,
+
+    # Liquidity constraints
+    "min_daily_volume_usd": 1_000_000,
+    "max_spread_bps": 10.0,
+
+    # Rebalance
+    "rebalance_threshold": 0.05,  # 5% drift
+})
+
+
 class SectorPairEngine:
     """
     Engine for computing factor-neutral sector pair positions.
@@ -212,43 +284,63 @@ class SectorPairEngine:
     3. Neutralize growth/value exposure across portfolio
     """
 
-    DEFAULT_CONFIG = {
-        # Sector selection
-        # NOTE: Only Technology and Healthcare have UCITS equivalents for US sector ETFs
-        # Financials (XLF) and Industrials (XLI) are blocked by PRIIPs for EU investors
-        "included_sectors": [
-            Sector.TECHNOLOGY,   # IUIT (US) vs EXV3 (EU) - 10% of sleeve
-            Sector.HEALTHCARE,   # IUHC (US) vs EXV4 (EU) - 10% of sleeve
-        ],
-
-        # Position sizing
-        "equal_weight_sectors": True,
-        "beta_adjust": True,
-
-        # Factor neutralization
-        "neutralize_growth_value": True,
-        "max_growth_exposure": 0.1,
-        "max_value_exposure": 0.1,
-
-        # Liquidity constraints
-        "min_daily_volume_usd": 1_000_000,
-        "max_spread_bps": 10.0,
-
-        # Rebalance
-        "rebalance_threshold": 0.05,  # 5% drift
-    }
+    # Read-only; overrides are merged into a per-engine copy
+    DEFAULT_CONFIG = _DEFAULT_CONFIG
 
     def __init__(self, config: Optional[Dict] = None):
         """Initialize with optional config overrides."""
-        self.config = {**self.DEFAULT_CONFIG, **(config or {})}
+        if config is None:
+            self.config = _DEFAULT_CONFIG
+        else:
+            self.config = {**_DEFAULT_CONFIG, **config}
         self.sector_pairs = SECTOR_PAIRS
 
+        # Hot-path settings hoisted out of the config mapping
+        self._beta_adjust: bool = bool(self.config["beta_adjust"])
+        self._neutralize_growth_value: bool = bool(self.config["neutralize_growth_value"])
+        self._max_growth_exposure: float = self.config["max_growth_exposure"]
+        self._max_value_exposure: float = self.config["max_value_exposure"]
+
+        # Included pairs resolved once (no per-call Sector-keyed lookups), with
+        # their static parameters as parallel arrays so compute_positions works
+        # on vectors rather than per-pair objects
+        self._included_pairs: Tuple[SectorPair, ...] = tuple(
+            pair
+            for pair in map(self.sector_pairs.get, self.config["included_sectors"])
+            if pair is not None
+        )
+        pairs = self._included_pairs
+        self._arr: Dict[str, np.ndarray] = {
+            "beta_ratio": np.array([p.beta_ratio for p in pairs], dtype=np.float64),
+            "us_g": np.array([p.us_growth_exposure for p in pairs], dtype=np.float64),
+            "eu_g": np.array([p.eu_growth_exposure for p in pairs], dtype=np.float64),
+            "us_v": np.array([p.us_value_exposure for p in pairs], dtype=np.float64),
+            "eu_v": np.array([p.eu_value_exposure for p in pairs], dtype=np.float64),
+        }
+        # EU legs are sized as -beta_ratio * weight; a negative ratio would flip
+        # the short leg long and break the long-US / short-EU sign convention
+        if (self._arr["beta_ratio"] < 0).any():
+            raise ValueError("Sector pair beta_ratio must be non-negative")
+
+        # Per-pair net growth tilt (US minus EU), static for the pair definitions
+        self._arr["net_g_diff"] = self._arr["us_g"] - self._arr["eu_g"]
+        # (3, n) per-leg loadings on growth, value and regional exposure
+        self._arr["us_loadings"] = np.stack(
+            [self._arr["us_g"], self._arr["us_v"], np.ones(len(pairs))]
+        )
+        self._arr["eu_loadings"] = np.stack(
+            [self._arr["eu_g"], self._arr["eu_v"], -np.ones(len(pairs))]
+        )
+
+        # Instruments depend only on the included pairs
+        self._instruments: Tuple[Mapping, ...] = self._build_instruments()
+
     def compute_positions(
         self,
         sleeve_nav: float,
         scaling: float = 1.0,
         current_prices: Optional[Dict[str, float]] = None
-    ) -> List[SectorPairPosition]:
+    ) -> Tuple[SectorPairPosition, ...]:
         """
         Compute target positions for all sector pairs.
 
@@ -258,159 +350,182 @@ class SectorPairEngine:
             current_prices: Optional dict of symbol -> price
 
         Returns:
-            List of SectorPairPosition targets
+            Tuple of SectorPairPosition targets
         """
-        cfg = self.config
-        positions = []
-
-        # Filter to included sectors
-        included = [
-            self.sector_pairs[s]
-            for s in cfg["included_sectors"]
-            if s in self.sector_pairs
-        ]
+        included = self._included_pairs
+        arr = self._arr
+        beta_adjust = self._beta_adjust
+        neutralize_growth_value = self._neutralize_growth_value
 
         if not included:
-            return []
+            return ()
 
         # Compute weight per sector
         n_sectors = len(included)
         weight_per_sector = sleeve_nav * scaling / n_sectors
-
-        # First pass: compute raw positions
-        raw_positions = []
-        for pair in included:
-            # Beta-adjust if configured
-            if cfg["beta_adjust"]:
-                # Adjust EU notional by beta ratio to match market exposure
-                us_notional = weight_per_sector / 2
-                eu_notional = -(weight_per_sector / 2) * pair.beta_ratio
-            else:
-                us_notional = weight_per_sector / 2
-                eu_notional = -weight_per_sector / 2
-
-            raw_positions.append({
-                "pair": pair,
-                "us_notional": us_notional,
-                "eu_notional": eu_notional,
-            })
-
-        # Second pass: factor neutralization
-        if cfg["neutralize_growth_value"]:
-            raw_positions = self._neutralize_factors(raw_positions)
+        half_weight = weight_per_sector / 2
+
+        # Without neutralization every pair keeps its raw sizing
+        if not neutralize_growth_value:
+            return self._fast_positions(half_weight)
+
+        # First pass: compute raw positions into preallocated per-pair arrays
+        us_notional = np.empty(n_sectors)
+        eu_notional = np.empty(n_sectors)
+        growth_adj = np.zeros(n_sectors)
+        value_adj = np.zeros(n_sectors)
+        us_notional.fill(half_weight)
+        if beta_adjust:
+            # Adjust EU notional by beta ratio to match market exposure
+            np.multiply(arr["beta_ratio"], -half_weight, out=eu_notional)
+        else:
+            eu_notional.fill(-half_weight)
+
+        # Second pass: factor neutralization (updates the arrays in place)
+        self._neutralize_factors(us_notional, eu_notional, growth_adj, value_adj)
+
+        # Compute effective exposures
+        net_regional = us_notional - eu_notional  # Positive = long US vs EU
+        net_growth = us_notional * arr["us_g"] + eu_notional * arr["eu_g"]
+        net_value = us_notional * arr["us_v"] + eu_notional * arr["eu_v"]
 
         # Build final positions
-        for raw in raw_positions:
-            pair = raw["pair"]
-            us_not = raw["us_notional"]
-            eu_not = raw["eu_notional"]
-
-            # Compute effective exposures
-            net_regional = us_not - eu_not  # Positive = long US vs EU
-            net_growth = (
-                us_not * pair.us_growth_exposure +
-                eu_not * pair.eu_growth_exposure
+        return tuple(
+            SectorPairPosition(
+                pair=pair,
+                us_notional=us_not,
+                eu_notional=eu_not,
+                growth_adjustment=g_adj,
+                value_adjustment=v_adj,
+                net_regional_exposure=regional,
+                net_growth_exposure=growth,
+                net_value_exposure=value,
             )
-            net_value = (
-                us_not * pair.us_value_exposure +
-                eu_not * pair.eu_value_exposure
+            for pair, us_not, eu_not, g_adj, v_adj, regional, growth, value in zip(
+                included,
+                us_notional.tolist(),
+                eu_notional.tolist(),
+                growth_adj.tolist(),
+                value_adj.tolist(),
+                net_regional.tolist(),
+                net_growth.tolist(),
+                net_value.tolist(),
             )
+        )
+
+    def _fast_positions(self, half_weight: float) -> Tuple[SectorPairPosition, ...]:
+        """
+        compute_positions without factor neutralization, in a single pass.
 
-            positions.append(SectorPairPosition(
+        Every pair keeps its raw sizing, so there are no adjustment arrays
+        to carry and each position is built straight from its leg notionals.
+
+        Args:
+            half_weight: Notional per leg before beta adjustment
+
+        Returns:
+            Tuple of SectorPairPosition targets
+        """
+        arr = self._arr
+        if self._beta_adjust:
+            eu_notional = arr["beta_ratio"] * -half_weight
+        else:
+            eu_notional = np.full(len(self._included_pairs), -half_weight)
+
+        net_growth = half_weight * arr["us_g"] + eu_notional * arr["eu_g"]
+        net_value = half_weight * arr["us_v"] + eu_notional * arr["eu_v"]
+
+        return tuple(
+            SectorPairPosition(
                 pair=pair,
-                us_notional=us_not,
+                us_notional=half_weight,
                 eu_notional=eu_not,
-                growth_adjustment=raw.get("growth_adj", 0.0),
-                value_adjustment=raw.get("value_adj", 0.0),
-                net_regional_exposure=net_regional,
-                net_growth_exposure=net_growth,
-                net_value_exposure=net_value,
-            ))
-
-        return positions
+                growth_adjustment=0.0,
+                value_adjustment=0.0,
+                net_regional_exposure=half_weight - eu_not,
+                net_growth_exposure=growth,
+                net_value_exposure=value,
+            )
+            for pair, eu_not, growth, value in zip(
+                self._included_pairs,
+                eu_notional.tolist(),
+                net_growth.tolist(),
+                net_value.tolist(),
+            )
+        )
 
     def _neutralize_factors(
         self,
-        raw_positions: List[Dict]
-    ) -> List[Dict]:
+        us_notional: np.ndarray,
+        eu_notional: np.ndarray,
+        growth_adj: np.ndarray,
+        value_adj: np.ndarray
+    ) -> None:
         """
         Adjust positions to neutralize growth/value exposure.
 
         Uses optimization to minimize factor exposure while
         maintaining regional exposure.
-        """
-        cfg = self.config
 
-        # Compute portfolio-level factor exposures
-        total_growth = 0.0
-        total_value = 0.0
-        total_regional = 0.0
+        All arrays hold one entry per included pair and are modified in place.
 
-        for raw in raw_positions:
-            pair = raw["pair"]
-            us_not = raw["us_notional"]
-            eu_not = raw["eu_notional"]
+        Args:
+            us_notional: US leg notionals
+            eu_notional: EU leg notionals
+            growth_adj: Growth adjustment applied to each pair
+            value_adj: Value adjustment applied to each pair (currently unused)
+        """
+        arr = self._arr
 
-            total_growth += (
-                us_not * pair.us_growth_exposure +
-                eu_not * pair.eu_growth_exposure
-            )
-            total_value += (
-                us_not * pair.us_value_exposure +
-                eu_not * pair.eu_value_exposure
-            )
-            total_regional += us_not - eu_not
+        # Compute portfolio-level factor exposures (growth, value, regional)
+        # in one pass over the stacked per-leg loadings
+        totals = arr["us_loadings"] @ us_notional + arr["eu_loadings"] @ eu_notional
+        total_growth, total_value, total_regional = totals.tolist()
 
         # If already neutral, no adjustment needed
-        if (abs(total_growth) <= cfg["max_growth_exposure"] * total_regional and
-            abs(total_value) <= cfg["max_value_exposure"] * total_regional):
-            return raw_positions
+        if (abs(total_growth) <= self._max_growth_exposure * total_regional and
+            abs(total_value) <= self._max_value_exposure * total_regional):
+            return
 
         # Simple neutralization: scale sectors with opposing exposures
         # This is a simplified approach; production would use optimization
 
-        # Find which sectors can offset
-        growth_offsetters = []
-        value_offsetters = []
-
-        for raw in raw_positions:
-            pair = raw["pair"]
-            net_growth = (
-                pair.us_growth_exposure - pair.eu_growth_exposure
-            )
-            net_value = (
-                pair.us_value_exposure - pair.eu_value_exposure
-            )
-
-            if net_growth * total_growth < 0:  # Opposite sign
-                growth_offsetters.append((raw, abs(net_growth)))
-            if net_value * total_value < 0:
-                value_offsetters.append((raw, abs(net_value)))
-
-        # Scale up offsetters slightly, scale down contributors
+        # Scale up offsetters slightly, scale down contributors, leave
+        # growth-neutral pairs alone: +1 contributes, -1 offsets, 0 neutral
         adjustment_factor = 0.1  # 10% adjustment
+        sign_mask = np.sign(arr["net_g_diff"] * total_growth)
+        scale = 1.0 - adjustment_factor * sign_mask
+        us_notional *= scale
+        eu_notional *= scale
+        adjusted = sign_mask != 0
+        growth_adj[adjusted] = -adjustment_factor * sign_mask[adjusted]
+
+    def flatten_positions(self, positions: Sequence[SectorPairPosition]) -> PositionsFlat:
+        """
+        Convert positions to parallel arrays for repeated return evaluation.
 
-        for raw in raw_positions:
-            pair = raw["pair"]
-            net_growth = pair.us_growth_exposure - pair.eu_growth_exposure
-
-            # If this sector contributes to unwanted growth exposure
-            if net_growth * total_growth > 0:
-                # Scale down slightly
-                raw["us_notional"] *= (1 - adjustment_factor)
-                raw["eu_notional"] *= (1 - adjustment_factor)
-                raw["growth_adj"] = -adjustment_factor
-            elif net_growth * total_growth < 0:
-                # Scale up slightly
-                raw["us_notional"] *= (1 + adjustment_factor)
-                raw["eu_notional"] *= (1 + adjustment_factor)
-                raw["growth_adj"] = adjustment_factor
+        Args:
+            positions: Sequence of SectorPairPosition
 
-        return raw_positions
+        Returns:
+            PositionsFlat with one entry per position
+        """
+        n = len(positions)
+        flat = PositionsFlat(
+            us_notional=np.fromiter((pos.us_notional for pos in positions), dtype=np.float64, count=n),
+            eu_notional=np.fromiter((pos.eu_notional for pos in positions), dtype=np.float64, count=n),
+            us_beta=np.fromiter((pos.pair.us_beta for pos in positions), dtype=np.float64, count=n),
+            eu_beta=np.fromiter((pos.pair.eu_beta for pos in positions), dtype=np.float64, count=n),
+            sectors=tuple(pos.pair.sector for pos in positions),
+        )
+        # Flattened positions are shared across bars (and cached), so freeze them
+        for values in (flat.us_notional, flat.eu_notional, flat.us_beta, flat.eu_beta):
+            values.flags.writeable = False
+        return flat
 
     def compute_expected_return(
         self,
-        positions: List[SectorPairPosition],
+        positions: Sequence[SectorPairPosition],
         us_market_return: float,
         eu_market_return: float,
         sector_returns: Optional[Dict[Sector, Tuple[float, float]]] = None
@@ -421,7 +536,7 @@ class SectorPairEngine:
         For backtesting with simplified assumptions.
 
         Args:
-            positions: List of SectorPairPosition
+            positions: Sequence of SectorPairPosition
             us_market_return: US market daily return
             eu_market_return: EU market daily return
             sector_returns: Optional dict of Sector -> (us_return, eu_return)
@@ -429,58 +544,130 @@ class SectorPairEngine:
         Returns:
             Total daily return
         """
-        total_return = 0.0
-        total_notional = 0.0
+        if len(positions) == 0:
+            return 0.0
 
-        for pos in positions:
-            pair = pos.pair
+        flat = self.flatten_positions(positions)
+        if not sector_returns:
+            return self.compute_expected_return_flat(flat, us_market_return, eu_market_return)
 
-            # Use sector-specific returns if provided, else scale from market
-            if sector_returns and pair.sector in sector_returns:
-                us_ret, eu_ret = sector_returns[pair.sector]
-            else:
-                # Scale market return by beta
-                us_ret = us_market_return * pair.us_beta
-                eu_ret = eu_market_return * pair.eu_beta
+        # Scale market return by beta
+        us_ret = us_market_return * flat.us_beta
+        eu_ret = eu_market_return * flat.eu_beta
 
-            # Position return
-            us_pnl = pos.us_notional * us_ret
-            eu_pnl = pos.eu_notional * eu_ret  # Negative notional = short
+        # Use sector-specific returns where provided
+        for i, sector in enumerate(flat.sectors):
+            sector_ret = sector_returns.get(sector)
+            if sector_ret is not None:
+                us_ret[i], eu_ret[i] = sector_ret
 
-            pair_return = us_pnl + eu_pnl
-            total_return += pair_return
-            total_notional += abs(pos.us_notional) + abs(pos.eu_notional)
+        # Position return (negative EU notional = short)
+        total_return = float(flat.us_notional @ us_ret + flat.eu_notional @ eu_ret)
+        # US legs are long and EU legs short, so gross notional needs no abs()
+        total_notional = float(flat.us_notional.sum() - flat.eu_notional.sum())
 
         # Return as percentage of notional
         if total_notional > 0:
             return total_return / (total_notional / 2)  # Divide by 2 for net exposure
         return 0.0
 
-    def get_tradeable_instruments(self) -> List[Dict]:
-        """Get list of instruments needed for sector pairs."""
-        instruments = []
+    def compute_expected_return_flat(
+        self,
+        flat: PositionsFlat,
+        us_market_return: float,
+        eu_market_return: float
+    ) -> float:
+        """
+        compute_expected_return on pre-flattened positions (market returns only).
+
+        Args:
+            flat: Positions from flatten_positions
+            us_market_return: US market daily return
+            eu_market_return: EU market daily return
+
+        Returns:
+            Total daily return
+        """
+        total_notional = float(flat.us_notional.sum() - flat.eu_notional.sum())
+        if total_notional <= 0:
+            return 0.0
+
+        # Position return (negative EU notional = short), beta-scaled market moves
+        total_return = (
+            us_market_return * float(flat.us_notional @ flat.us_beta)
+            + eu_market_return * float(flat.eu_notional @ flat.eu_beta)
+        )
+        return total_return / (total_notional / 2)  # Divide by 2 for net exposure
+
+    def compute_expected_return_batch(
+        self,
+        positions: Sequence[SectorPairPosition],
+        us_market_returns: np.ndarray,
+        eu_market_returns: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized compute_expected_return over many bars with fixed positions.
+
+        With positions held constant, each bar's return is linear in the two
+        market returns, so the whole series reduces to two scalar loadings.
+
+        Args:
+            positions: Sequence of SectorPairPosition (held for every bar)
+            us_market_returns: US market daily returns, one per bar
+            eu_market_returns: EU market daily returns, one per bar
 
-        for sector in self.config["included_sectors"]:
-            if sector not in self.sector_pairs:
-                continue
+        Returns:
+            Array of daily returns, one per bar
+        """
+        us_mkt = np.asarray(us_market_returns, dtype=np.float64)
+        eu_mkt = np.asarray(eu_market_returns, dtype=np.float64)
+
+        flat = self.flatten_positions(positions)
+        total_notional = float(flat.us_notional.sum() - flat.eu_notional.sum())
+        if total_notional <= 0:
+            return np.zeros(np.broadcast(us_mkt, eu_mkt).shape)
 
-            pair = self.sector_pairs[sector]
-            instruments.append({
+        half_notional = total_notional / 2  # Divide by 2 for net exposure
+        us_loading = float(flat.us_notional @ flat.us_beta) / half_notional
+        eu_loading = float(flat.eu_notional @ flat.eu_beta) / half_notional
+        return us_loading * us_mkt + eu_loading * eu_mkt
+
+    def get_tradeable_instruments(self) -> Tuple[Mapping, ...]:
+        """Get the instruments needed for sector pairs (read-only, shared)."""
+        return self._instruments
+
+    def _build_instruments(self) -> Tuple[Mapping, ...]:
+        """Build the static US/EU instrument descriptions for the included pairs."""
+        instruments = []
+
+        for pair in self._included_pairs:
+            sector = pair.sector
+            instruments.append(MappingProxyType({
                 "symbol": pair.us_symbol,
                 "name": pair.us_name,
                 "region": "US",
-                "sector": sector.value,
+                "sector": sector.sector_str,
                 "exchange": "ARCA",  # Most sector ETFs trade on ARCA
-            })
-            instruments.append({
+            }))
+            instruments.append(MappingProxyType({
                 "symbol": pair.eu_symbol,
                 "name": pair.eu_name,
                 "region": "EU",
-                "sector": sector.value,
+                "sector": sector.sector_str,
                 "exchange": "XETR",  # Most EU ETFs on Xetra
-            })
+            }))
+
+        return tuple(instruments)
+
+
+# Default-config engine shared by the backtest helpers below
+_ENGINE = SectorPairEngine()
+
 
-        return instruments
+@lru_cache(maxsize=128)
+def _cached_flat_positions(sleeve_nav: float, scaling: float) -> PositionsFlat:
+    """Default-engine positions, flattened; fully determined by (sleeve_nav, scaling)."""
+    return _ENGINE.flatten_positions(_ENGINE.compute_positions(sleeve_nav, scaling))
 
 
 # Convenience function for backtest
@@ -494,10 +681,9 @@ def compute_sector_pairs_return(
     Compute Sector RV return for backtest.
 
     Simplified interface using market returns (beta-adjusted).
+    Positions are computed and flattened once per (sleeve_nav, scaling),
+    which rarely changes between bars.
     """
-    engine = SectorPairEngine()
-    positions = engine.compute_positions(sleeve_nav, scaling)
+    flat = _cached_flat_positions(sleeve_nav, scaling)
 
-    return engine.compute_expected_return(
-        positions, us_return, eu_return
-    )
+    return _ENGINE.compute_expected_return_flat(flat, us_return, eu_return)
@@ -21,14 +21,19 @@ Usage:
     print(report.summary())
 """
 
+import io
 import logging
+import os
+import time
 from dataclasses import dataclass, field
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 from .utils.invariants import (
-    assert_position_id_valid,
+    _position_id_error,
     assert_no_conflicting_orders,
     validate_instruments_config,
     build_id_mappings,
@@ -37,8 +42,26 @@ from .utils.invariants import (
 
 logger = logging.getLogger(__name__)
 
+# Mock FX rates used when a scenario does not specify its own
+_DEFAULT_FX_RATES: Dict[str, float] = {
+    "EURUSD": 1.05,
+    "GBPUSD": 1.27,
+}
+
+# FX pair used to convert each non-USD instrument currency into USD
+_FX_PAIR_BY_CURRENCY: Dict[str, str] = {
+    "EUR": "EURUSD",
+    "GBP": "GBPUSD",
+}
+
+# Scenario batches at or below this size always run serially (pool startup dominates)
+_PARALLEL_MIN_SCENARIOS = 3
+
+# Portfolios at or below this size are cheaper to recompute than to memoize
+_MEMO_MIN_POSITIONS = 8
+
 
-@dataclass
+@dataclass(slots=True)
 class SimulationScenario:
     """
     Defines a simulation scenario for testing.
@@ -58,13 +81,10 @@ class SimulationScenario:
     glidepath_day: int = 0
     vix_level: float = 16.0
     nav: float = 280000.0
-    fx_rates: Dict[str, float] = field(default_factory=lambda: {
-        "EURUSD": 1.05,
-        "GBPUSD": 1.27,
-    })
+    fx_rates: Dict[str, float] = field(default_factory=_DEFAULT_FX_RATES.copy)
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationOrder:
     """Represents an order that would be generated."""
     instrument_id: str
@@ -74,7 +94,7 @@ class SimulationOrder:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     """Result of running a single scenario."""
     scenario_name: str
@@ -89,37 +109,37 @@ class SimulationResult:
 
     def summary(self) -> str:
         """Generate a human-readable summary."""
-        lines = [
-            f"=== Scenario: {self.scenario_name} ===",
-            f"Status: {'PASS' if self.success else 'FAIL'}",
-        ]
+        return "\n".join(self._summary_lines())
+
+    def _summary_lines(self) -> Iterator[str]:
+        """Yield the lines of summary()."""
+        yield f"=== Scenario: {self.scenario_name} ==="
+        yield f"Status: {'PASS' if self.success else 'FAIL'}"
 
         if self.invariant_violations:
-            lines.append(f"Invariant Violations ({len(self.invariant_violations)}):")
+            yield f"Invariant Violations ({len(self.invariant_violations)}):"
             for v in self.invariant_violations:
-                lines.append(f"  - {v}")
+                yield "  - %s" % v
 
         if self.warnings:
-            lines.append(f"Warnings ({len(self.warnings)}):")
+            yield f"Warnings ({len(self.warnings)}):"
             for w in self.warnings:
-                lines.append(f"  - {w}")
+                yield "  - %s" % w
 
-        lines.append(f"Orders Generated: {len(self.orders)}")
+        yield f"Orders Generated: {len(self.orders)}"
         for order in self.orders:
-            lines.append(f"  {order.side} {order.quantity} {order.instrument_id}")
+            yield "  %s %s %s" % (order.side, order.quantity, order.instrument_id)
 
-        lines.append(f"Position Changes: {len(self.position_changes)}")
+        yield f"Position Changes: {len(self.position_changes)}"
         for inst_id, (before, after) in self.position_changes.items():
             if before != after:
-                lines.append(f"  {inst_id}: {before} -> {after}")
-
-        lines.append(f"Gross Exposure: {self.gross_exposure_before:.2f} -> {self.gross_exposure_after:.2f}")
-        lines.append(f"Execution Time: {self.execution_time_ms:.2f}ms")
+                yield "  %s: %s -> %s" % (inst_id, before, after)
 
-        return "\n".join(lines)
+        yield f"Gross Exposure: {self.gross_exposure_before:.2f} -> {self.gross_exposure_after:.2f}"
+        yield f"Execution Time: {self.execution_time_ms:.2f}ms"
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationReport:
     """Report summarizing all simulation scenarios."""
     results: List[SimulationResult] = field(default_factory=list)
@@ -140,25 +160,25 @@ class SimulationReport:
 
     def summary(self) -> str:
         """Generate overall summary."""
-        lines = [
-            "=" * 60,
-            "SIMULATION REPORT",
-            "=" * 60,
-            f"Total Scenarios: {self.total_scenarios}",
-            f"Passed: {self.passed_scenarios}",
-            f"Failed: {self.failed_scenarios}",
-            f"Total Invariant Violations: {self.total_invariant_violations}",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        rule = "=" * 60
+
+        w(f"{rule}\nSIMULATION REPORT\n{rule}\n")
+        w(f"Total Scenarios: {self.total_scenarios}\n")
+        w(f"Passed: {self.passed_scenarios}\n")
+        w(f"Failed: {self.failed_scenarios}\n")
+        w(f"Total Invariant Violations: {self.total_invariant_violations}\n")
+        w("\n")
 
         for result in self.results:
             status = "✓" if result.success else "✗"
-            lines.append(f"{status} {result.scenario_name}: {len(result.orders)} orders")
+            w(f"{status} {result.scenario_name}: {len(result.orders)} orders\n")
 
-        lines.append("")
-        lines.append("=" * 60)
+        w("\n")
+        w(rule)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     @property
     def all_passed(self) -> bool:
@@ -166,6 +186,35 @@ class SimulationReport:
         return self.failed_scenarios == 0
 
 
+def _blend_and_diff(
+    initial: np.ndarray,
+    target: np.ndarray,
+    alpha: float,
+    threshold: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Glidepath blend kernel.
+
+    Args:
+        initial: Current quantities
+        target: Target quantities
+        alpha: Glidepath weight on the target (0.0 to 1.0)
+        threshold: Minimum absolute quantity change that generates an order
+
+    Returns:
+        Tuple of (blended quantities, blended - initial, order mask)
+    """
+    if alpha == 1.0:
+        # Fully on target: the blend is the target itself
+        blended = np.array(target, dtype=np.float64)
+    else:
+        blended = np.multiply(target, alpha)
+        blended += (1 - alpha) * initial
+    diff = np.subtract(blended, initial)
+    mask = np.abs(diff) > threshold
+    return blended, diff, mask
+
+
 class SimulationRunner:
     """
     Runs simulation scenarios to validate execution pipeline.
@@ -203,6 +252,20 @@ class SimulationRunner:
             instruments_config
         )
 
+        # FX pair for each non-USD instrument, flattened once across sleeves so
+        # gross exposure needs a single lookup per position
+        self._fx_pair_by_id: Dict[str, str] = {
+            inst_id: _FX_PAIR_BY_CURRENCY[spec["currency"]]
+            for instruments in instruments_config.values()
+            if isinstance(instruments, dict)
+            for inst_id, spec in instruments.items()
+            if isinstance(spec, dict) and spec.get("currency") in _FX_PAIR_BY_CURRENCY
+        }
+
+        # Memo of pure per-scenario computations, only live inside run_scenarios
+        # (whose scenarios keep the keyed input dicts alive and unchanged)
+        self._scenario_cache: Optional[Dict[Tuple, Tuple[Tuple, Any]]] = None
+
         logger.info(
             f"SimulationRunner initialized with {len(self.config_to_symbol)} instruments"
         )
@@ -217,7 +280,7 @@ class SimulationRunner:
         Returns:
             SimulationResult with orders and validation results
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         violations = []
         warnings = []
         orders = []
@@ -225,59 +288,79 @@ class SimulationRunner:
 
         logger.info(f"Running simulation: {scenario.name}")
 
-        # Step 1: Validate position IDs
-        for inst_id in scenario.mock_positions.keys():
-            try:
-                assert_position_id_valid(
-                    inst_id,
-                    self.instruments_config,
-                    context=f"simulation:{scenario.name}"
-                )
-            except InvariantError as e:
-                violations.append(str(e))
+        # Steps 1-2 in a single pass over the positions
+        mock_prices = scenario.mock_prices
+        config_ids = self.config_to_symbol.keys()
+        context = f"simulation:{scenario.name}"
+        for inst_id in scenario.mock_positions:
+            # Step 1: Validate position ID (against the mappings built at init)
+            error = _position_id_error(
+                inst_id, config_ids, self.symbol_to_config, context
+            )
+            if error:
+                violations.append(error)
 
-        # Step 2: Check for missing prices
-        for inst_id in scenario.mock_positions.keys():
-            if inst_id not in scenario.mock_prices:
+            # Step 2: Check for missing prices
+            if inst_id not in mock_prices:
                 warnings.append(f"No price for position {inst_id}")
 
         # Step 3: Simulate glidepath blending
-        if scenario.glidepath_day >= 0:
-            alpha = min(scenario.glidepath_day / 10.0, 1.0)
+        # Day < 0 skips the glidepath, and day 0 (alpha = 0) keeps every
+        # position as-is, so neither can change positions or generate orders
+        glidepath_day = scenario.glidepath_day
+        if glidepath_day > 0:
+            alpha = 1.0 if glidepath_day >= 10 else glidepath_day / 10.0
 
             # Get initial and target positions (simplified - in real system from strategy)
-            initial_positions = scenario.mock_positions.copy()
-            target_positions = self._compute_mock_targets(scenario)
+            # Read-only below, so no copy is needed
+            initial_positions = scenario.mock_positions
+            target_positions = self._memoized(
+                scenario, "targets", self._compute_mock_targets
+            )
+
+            # Held instruments first, then any target-only instruments
+            # (initial position 0), as parallel arrays
+            inst_ids = list(initial_positions)
+            inst_ids.extend(
+                inst_id for inst_id in target_positions if inst_id not in initial_positions
+            )
+            n = len(inst_ids)
+            initial_arr = np.zeros(n)
+            initial_arr[:len(initial_positions)] = np.fromiter(
+                initial_positions.values(), dtype=np.float64, count=len(initial_positions)
+            )
+            target_get = target_positions.get
+            target_arr = np.fromiter(
+                (target_get(inst_id, 0.0) for inst_id in inst_ids),
+                dtype=np.float64, count=n,
+            )
 
             # Compute blended positions
-            all_instruments = set(initial_positions) | set(target_positions)
-            blended_positions = {}
-
-            for inst_id in all_instruments:
-                initial = initial_positions.get(inst_id, 0.0)
-                target = target_positions.get(inst_id, 0.0)
-                blended = alpha * target + (1 - alpha) * initial
-                blended_positions[inst_id] = blended
-
-                if initial != blended:
-                    position_changes[inst_id] = (initial, blended)
-
-            # Step 4: Generate orders from position differences
-            for inst_id, blended_qty in blended_positions.items():
-                current_qty = scenario.mock_positions.get(inst_id, 0.0)
-                diff = blended_qty - current_qty
-
-                if abs(diff) > 0.5:  # Threshold
-                    side = "BUY" if diff > 0 else "SELL"
-                    price = scenario.mock_prices.get(inst_id)
-
-                    orders.append(SimulationOrder(
-                        instrument_id=inst_id,
-                        side=side,
-                        quantity=abs(diff),
-                        limit_price=price,
-                        reason=f"glidepath_day_{scenario.glidepath_day}"
-                    ))
+            blended_arr, diff_arr, order_mask = _blend_and_diff(
+                initial_arr, target_arr, alpha, 0.5  # Order threshold
+            )
+
+            changed = np.flatnonzero(blended_arr != initial_arr).tolist()
+            position_changes = dict(zip(
+                [inst_ids[i] for i in changed],
+                zip(initial_arr[changed].tolist(), blended_arr[changed].tolist()),
+            ))
+
+            # Step 4: Generate orders from position differences, field by
+            # field, then construct the orders positionally in one pass
+            order_idx = np.flatnonzero(order_mask)
+            order_diffs = diff_arr[order_idx]
+            order_ids = [inst_ids[i] for i in order_idx.tolist()]
+            order_sides = ["BUY" if diff > 0 else "SELL" for diff in order_diffs.tolist()]
+            order_qtys = np.abs(order_diffs).tolist()
+            order_prices = list(map(scenario.mock_prices.get, order_ids))
+            reason = f"glidepath_day_{glidepath_day}"
+            orders = [
+                SimulationOrder(inst_id, side, qty, price, reason)
+                for inst_id, side, qty, price in zip(
+                    order_ids, order_sides, order_qtys, order_prices
+                )
+            ]
 
         # Step 5: Validate orders for conflicts
         try:
@@ -289,19 +372,23 @@ class SimulationRunner:
             violations.append(str(e))
 
         # Calculate execution time
-        elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         # Calculate gross exposure
-        gross_before = self._calc_gross_exposure(
-            scenario.mock_positions,
-            scenario.mock_prices,
-            scenario.fx_rates,
-        )
-        gross_after = self._calc_gross_exposure(
-            {inst_id: b for inst_id, (_, b) in position_changes.items()},
-            scenario.mock_prices,
-            scenario.fx_rates,
-        )
+        gross_before = self._scenario_gross_exposure(scenario)
+        # Post-trade exposure of the full portfolio, updated incrementally from
+        # the changed instruments only
+        gross_after = gross_before
+        if position_changes:
+            gross_after += self._calc_gross_exposure(
+                {inst_id: b for inst_id, (_, b) in position_changes.items()},
+                scenario.mock_prices,
+                scenario.fx_rates,
+            ) - self._calc_gross_exposure(
+                {inst_id: a for inst_id, (a, _) in position_changes.items()},
+                scenario.mock_prices,
+                scenario.fx_rates,
+            )
 
         result = SimulationResult(
             scenario_name=scenario.name,
@@ -319,22 +406,40 @@ class SimulationRunner:
         return result
 
     def run_scenarios(
-        self, scenarios: List[SimulationScenario]
+        self,
+        scenarios: List[SimulationScenario],
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
     ) -> SimulationReport:
         """
         Run multiple simulation scenarios.
 
         Args:
             scenarios: List of scenarios to run
+            parallel: Run scenarios in a process pool (scenarios are independent)
+            max_workers: Pool size when parallel (default: half the CPUs)
 
         Returns:
-            SimulationReport summarizing all results
+            SimulationReport summarizing all results (in scenario order)
         """
         report = SimulationReport()
 
-        for scenario in scenarios:
-            result = self.run_scenario(scenario)
-            report.add_result(result)
+        if parallel and len(scenarios) >= _PARALLEL_MIN_SCENARIOS:
+            workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+            with ProcessPoolExecutor(max_workers=min(workers, len(scenarios))) as pool:
+                # map() yields results in submission order
+                for result in pool.map(self.run_scenario, scenarios):
+                    report.add_result(result)
+            return report
+
+        # Scenarios often share the same positions/prices (e.g. predeploy checks)
+        self._scenario_cache = {}
+        try:
+            for scenario in scenarios:
+                result = self.run_scenario(scenario)
+                report.add_result(result)
+        finally:
+            self._scenario_cache = None
 
         return report
 
@@ -353,12 +458,17 @@ class SimulationRunner:
         Returns:
             SimulationReport with validation results
         """
+        # One FX dict shared by every scenario (read-only during the run), which
+        # also lets run_scenarios reuse per-portfolio computations across them
+        fx_rates = dict(_DEFAULT_FX_RATES)
+
         scenarios = [
             # Scenario 1: Normal day (current state)
             SimulationScenario(
                 name="Current State Validation",
                 mock_positions=current_positions,
                 mock_prices=current_prices,
+                fx_rates=fx_rates,
                 glidepath_day=-1,  # Skip glidepath
             ),
 
@@ -367,6 +477,7 @@ class SimulationRunner:
                 name="Glidepath Day 0",
                 mock_positions=current_positions,
                 mock_prices=current_prices,
+                fx_rates=fx_rates,
                 glidepath_day=0,
             ),
 
@@ -375,6 +486,7 @@ class SimulationRunner:
                 name="Glidepath Day 1",
                 mock_positions=current_positions,
                 mock_prices=current_prices,
+                fx_rates=fx_rates,
                 glidepath_day=1,
             ),
 
@@ -383,6 +495,7 @@ class SimulationRunner:
                 name="Glidepath Day 5",
                 mock_positions=current_positions,
                 mock_prices=current_prices,
+                fx_rates=fx_rates,
                 glidepath_day=5,
             ),
 
@@ -391,6 +504,7 @@ class SimulationRunner:
                 name="Glidepath Day 10+",
                 mock_positions=current_positions,
                 mock_prices=current_prices,
+                fx_rates=fx_rates,
                 glidepath_day=10,
             ),
         ]
@@ -405,17 +519,17 @@ class SimulationRunner:
 
         In real system, this would come from strategy.compute().
         For simulation, we use a simplified model.
+
+        The returned dict may be the scenario's own positions and must not
+        be mutated.
         """
         # Simple target: scale current positions toward a target gross exposure
         target_gross_pct = 1.6  # 160% gross
-        current_gross = self._calc_gross_exposure(
-            scenario.mock_positions,
-            scenario.mock_prices,
-            scenario.fx_rates,
-        )
+        current_gross = self._scenario_gross_exposure(scenario)
 
         if current_gross == 0:
-            return scenario.mock_positions.copy()
+            # Callers only read targets, so the positions can be shared as-is
+            return scenario.mock_positions
 
         scale_factor = (scenario.nav * target_gross_pct) / max(current_gross, 1)
 
@@ -425,6 +539,49 @@ class SimulationRunner:
 
         return targets
 
+    def _memoized(
+        self,
+        scenario: SimulationScenario,
+        kind: str,
+        compute: Callable[[SimulationScenario], Any],
+    ) -> Any:
+        """
+        Memoize compute(scenario) across scenarios sharing the same inputs.
+
+        Keyed on the identity of the scenario's positions/prices/FX dicts (and
+        NAV). The cached entry holds references to those dicts, so an id can
+        never be reused for a different object while it is cached.
+
+        Args:
+            scenario: Scenario whose inputs determine the result
+            kind: Name of the cached computation
+            compute: Pure function of the scenario inputs
+
+        Returns:
+            The (possibly cached) result of compute(scenario)
+        """
+        cache = self._scenario_cache
+        if cache is None or len(scenario.mock_positions) <= _MEMO_MIN_POSITIONS:
+            return compute(scenario)
+
+        inputs = (scenario.mock_positions, scenario.mock_prices, scenario.fx_rates)
+        key = (kind, scenario.nav, id(inputs[0]), id(inputs[1]), id(inputs[2]))
+        hit = cache.get(key)
+        if hit is not None and all(a is b for a, b in zip(hit[0], inputs)):
+            return hit[1]
+
+        value = compute(scenario)
+        cache[key] = (inputs, value)
+        return value
+
+    def _scenario_gross_exposure(self, scenario: SimulationScenario) -> float:
+        """Gross exposure of the scenario's own positions (memoized)."""
+        return self._memoized(
+            scenario,
+            "gross",
+            lambda s: self._calc_gross_exposure(s.mock_positions, s.mock_prices, s.fx_rates),
+        )
+
     def _calc_gross_exposure(
         self,
         positions: Dict[str, float],
@@ -432,39 +589,39 @@ class SimulationRunner:
         fx_rates: Dict[str, float],
     ) -> float:
         """Calculate gross exposure from positions."""
+        # FX conversion (simplified): EUR and GBP instruments into USD
+        get_fx_pair = self._fx_pair_by_id.get
+        get_price = prices.get
+        get_fx = fx_rates.get
+
         total = 0.0
         for inst_id, qty in positions.items():
-            price = prices.get(inst_id, 0.0)
-            notional = abs(qty) * price
-
-            # Apply FX conversion (simplified)
-            for sleeve, instruments in self.instruments_config.items():
-                if inst_id in instruments:
-                    spec = instruments[inst_id]
-                    currency = spec.get("currency", "USD")
-                    if currency == "EUR":
-                        notional *= fx_rates.get("EURUSD", 1.0)
-                    elif currency == "GBP":
-                        notional *= fx_rates.get("GBPUSD", 1.0)
-                    break
-
-            total += notional
+            price = get_price(inst_id, 0.0)
+            if price == 0.0:
+                continue
+            fx_pair = get_fx_pair(inst_id)
+            fx = get_fx(fx_pair, 1.0) if fx_pair is not None else 1.0
+            total += abs(qty) * price * fx
 
         return total
 
 
-def create_standard_scenarios(
+# Sample book for the most recently seen instruments config:
+# (config, sample_positions, sample_prices). Matched by identity; holding the
+# config reference means at most one config is kept alive.
+_sample_book_cache: Optional[Tuple[Dict[str, Any], Dict[str, float], Dict[str, float]]] = None
+
+
+def _sample_book(
     instruments_config: Dict[str, Any],
-) -> List[SimulationScenario]:
-    """
-    Create standard simulation scenarios for testing.
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Build (or reuse) sample positions and prices for the config's instruments."""
+    global _sample_book_cache
 
-    Args:
-        instruments_config: Instrument configuration
+    cached = _sample_book_cache
+    if cached is not None and cached[0] is instruments_config:
+        return cached[1], cached[2]
 
-    Returns:
-        List of standard scenarios
-    """
     # Build sample positions using internal IDs
     sample_positions = {}
     sample_prices = {}
@@ -476,6 +633,29 @@ def create_standard_scenarios(
                 sample_positions[inst_id] = 10.0
                 sample_prices[inst_id] = 100.0  # Default price
 
+    _sample_book_cache = (instruments_config, sample_positions, sample_prices)
+    return sample_positions, sample_prices
+
+
+def create_standard_scenarios(
+    instruments_config: Dict[str, Any],
+) -> List[SimulationScenario]:
+    """
+    Create standard simulation scenarios for testing.
+
+    The sample book is cached per config object; each call still returns
+    fresh scenario dicts, so callers may mutate them.
+
+    Args:
+        instruments_config: Instrument configuration
+
+    Returns:
+        List of standard scenarios
+    """
+    cached_positions, cached_prices = _sample_book(instruments_config)
+    sample_positions = dict(cached_positions)
+    sample_prices = dict(cached_prices)
+
     return [
         SimulationScenario(
             name="Empty Portfolio",
@@ -14,12 +14,14 @@ Key Features:
 """
 
 import logging
+from bisect import bisect_right
 import numpy as np
 import pandas as pd
 from datetime import datetime, date, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 
 from .portfolio import PortfolioState, Sleeve
 from .strategy_logic import OrderSpec
@@ -35,24 +37,49 @@ class SovereignCountry(Enum):
     PORTUGAL = "portugal"
 
 
-class StressLevel(Enum):
-    """Sovereign stress levels."""
-    LOW = "low"           # Normal conditions
-    ELEVATED = "elevated"  # Widening spreads
-    HIGH = "high"         # Significant stress
-    CRISIS = "crisis"     # Crisis conditions
+class StressLevel(IntEnum):
+    """
+    Sovereign stress levels, ordered by severity.
 
+    Integer-valued so comparisons in the signal path are plain int
+    compares; the lower-case name is available as ``level_str``.
+    """
+    LOW = 0           # Normal conditions
+    ELEVATED = 1      # Widening spreads
+    HIGH = 2          # Significant stress
+    CRISIS = 3        # Crisis conditions
 
-class OverlayAction(Enum):
-    """Actions for overlay management."""
-    HOLD = "hold"         # No change
-    ADD = "add"           # Add protection
-    INCREASE = "increase" # Increase protection
-    MONETIZE = "monetize" # Take profits
-    ROLL = "roll"         # Roll positions
+    @property
+    def level_str(self) -> str:
+        """Lower-case level name, e.g. "elevated"."""
+        return _STRESS_LEVEL_STR[self]
 
 
-@dataclass
+class OverlayAction(IntEnum):
+    """
+    Actions for overlay management.
+
+    Integer-valued like StressLevel; the lower-case name is available
+    as ``action_str``.
+    """
+    HOLD = 0          # No change
+    ADD = 1           # Add protection
+    INCREASE = 2      # Increase protection
+    MONETIZE = 3      # Take profits
+    ROLL = 4          # Roll positions
+
+    @property
+    def action_str(self) -> str:
+        """Lower-case action name, e.g. "monetize"."""
+        return _OVERLAY_ACTION_STR[self]
+
+
+_STRESS_LEVEL_STR: Dict[StressLevel, str] = {s: s.name.lower() for s in StressLevel}
+_STRESS_LEVELS: Tuple[StressLevel, ...] = tuple(StressLevel)
+_OVERLAY_ACTION_STR: Dict[OverlayAction, str] = {a: a.name.lower() for a in OverlayAction}
+
+
+@dataclass(slots=True)
 class SovereignProxy:
     """
     US-listed proxy for sovereign exposure.
@@ -71,6 +98,19 @@ class SovereignProxy:
     otm_pct: float = 0.10      # Target OTM percentage for puts
     spread_width: float = 0.05  # Put spread width as % of strike
 
+    # Key into OverlayConfig.country_allocations (defaults to lowercase symbol)
+    allocation_key: str = ""
+
+    # Strike as a fraction of spot for the long and short put legs
+    long_strike_factor: float = field(init=False, repr=False, compare=False)
+    short_strike_factor: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.allocation_key:
+            self.allocation_key = self.symbol.lower()
+        self.long_strike_factor = 1 - self.otm_pct
+        self.short_strike_factor = 1 - self.otm_pct - self.spread_width
+
 
 # US-listed proxies for European sovereign risk
 SOVEREIGN_PROXIES = {
@@ -82,6 +122,7 @@ SOVEREIGN_PROXIES = {
         options_available=True,
         otm_pct=0.10,
         spread_width=0.05,
+        allocation_key="italy",
     ),
     SovereignCountry.FRANCE: SovereignProxy(
         country=SovereignCountry.FRANCE,
@@ -91,6 +132,7 @@ SOVEREIGN_PROXIES = {
         options_available=True,
         otm_pct=0.08,
         spread_width=0.04,
+        allocation_key="france",
     ),
     # EUR/USD as currency proxy for all periphery
     "EUR_USD": SovereignProxy(
@@ -101,6 +143,7 @@ SOVEREIGN_PROXIES = {
         options_available=True,
         otm_pct=0.05,
         spread_width=0.03,
+        allocation_key="eur_usd",
     ),
     # EU Banks as systemic risk proxy
     "EU_BANKS": SovereignProxy(
@@ -111,11 +154,54 @@ SOVEREIGN_PROXIES = {
         options_available=True,
         otm_pct=0.12,
         spread_width=0.06,
+        allocation_key="eu_banks",
     ),
 }
 
 
-@dataclass
+def _window_stats(histories: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    52-week highs and 20-bar lagged closes for several histories.
+
+    Each history's last 252 closes are right-aligned in a NaN-padded
+    matrix so one NaN-skipping fmax reduction covers every row.
+
+    Args:
+        histories: Price arrays with at least 20 closes each
+
+    Returns:
+        Tuple of (highs, lagged closes), one entry per history
+    """
+    window = np.full((len(histories), 252), np.nan)
+    for row, arr in zip(window, histories):
+        tail = arr[-252:]
+        row[252 - tail.size:] = tail
+    return np.fmax.reduce(window, axis=1), window[:, -20]
+
+
+def _overlay_order(
+    instrument_id: str,
+    side: str,
+    quantity: int,
+    order_type: str,
+    reason: str,
+    limit_price: Optional[float] = None,
+    urgency: str = "normal"
+) -> OrderSpec:
+    """Build an overlay-sleeve OrderSpec."""
+    return OrderSpec(
+        instrument_id=instrument_id,
+        side=side,
+        quantity=quantity,
+        order_type=order_type,
+        limit_price=limit_price,
+        sleeve=Sleeve.EUROPE_VOL_CONVEX,
+        reason=reason,
+        urgency=urgency,
+    )
+
+
+@dataclass(slots=True)
 class SovereignStressSignal:
     """Sovereign stress signal output."""
     country: SovereignCountry
@@ -127,7 +213,7 @@ class SovereignStressSignal:
     commentary: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OverlayPosition:
     """A position in the sovereign overlay."""
     position_id: str
@@ -141,10 +227,9 @@ class OverlayPosition:
     current_value: float = 0.0
     delta: float = 0.0
 
-    @property
-    def days_to_expiry(self) -> int:
-        """Days until expiration."""
-        return (self.expiry - date.today()).days
+    def days_to_expiry(self, today: Optional[date] = None) -> int:
+        """Days until expiration as of today (defaults to the system date)."""
+        return (self.expiry - (today or date.today())).days
 
     @property
     def pnl(self) -> float:
@@ -152,7 +237,13 @@ class OverlayPosition:
         return self.current_value - self.premium_paid
 
 
-@dataclass
+# OverlayBudget fields that the cached derived values depend on
+_BUDGET_INPUTS = frozenset({
+    "annual_budget_pct", "nav_at_year_start", "used_ytd", "realized_gains_ytd",
+})
+
+
+@dataclass(slots=True)
 class OverlayBudget:
     """Budget for sovereign overlay."""
     annual_budget_pct: float  # 0.0025 to 0.0050 (25-50bps)
@@ -160,16 +251,34 @@ class OverlayBudget:
     used_ytd: float = 0.0
     realized_gains_ytd: float = 0.0
 
+    # Derived values, computed on first access after an input changes
+    _total_budget: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _remaining: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _BUDGET_INPUTS:
+            object.__setattr__(self, "_total_budget", None)
+            object.__setattr__(self, "_remaining", None)
+
     @property
     def total_budget(self) -> float:
         """Total annual budget in dollars."""
-        return self.nav_at_year_start * self.annual_budget_pct
+        total = self._total_budget
+        if total is None:
+            total = self._total_budget = self.nav_at_year_start * self.annual_budget_pct
+        return total
 
     @property
     def remaining(self) -> float:
         """Remaining budget."""
-        # Can recycle 50% of realized gains
-        return max(0, self.total_budget - self.used_ytd + self.realized_gains_ytd * 0.5)
+        remaining = self._remaining
+        if remaining is None:
+            # Can recycle 50% of realized gains
+            remaining = self._remaining = max(
+                0, self.total_budget - self.used_ytd + self.realized_gains_ytd * 0.5
+            )
+        return remaining
 
     @property
     def monthly_budget(self) -> float:
@@ -236,6 +345,9 @@ class OverlayConfig:
         default_factory=RatesFragmentationConfig
     )
 
+    # Optional .npz file for persisting proxy price histories across restarts
+    price_cache_path: Optional[str] = None
+
     @classmethod
     def from_settings(cls, settings: Dict[str, Any]) -> "OverlayConfig":
         """Create config from settings dict."""
@@ -272,6 +384,7 @@ class OverlayConfig:
             use_spreads=overlay_settings.get('use_spreads', True),
             spread_width_pct=overlay_settings.get('spread_width_pct', 0.05),
             rates_config=rates_config,
+            price_cache_path=overlay_settings.get('price_cache_path'),
         )
 
 
@@ -305,17 +418,65 @@ class SovereignCrisisOverlay:
             OverlayConfig.from_settings(settings) if settings else OverlayConfig()
         )
 
+        # SOVEREIGN_PROXIES is module-constant; iterate a snapshot
+        self._proxy_items: Tuple[Tuple[Any, SovereignProxy], ...] = tuple(SOVEREIGN_PROXIES.items())
+        self._proxy_symbols: Tuple[str, ...] = tuple(proxy.symbol for _, proxy in self._proxy_items)
+
         # State tracking
         self._positions: Dict[str, OverlayPosition] = {}
+        self._positions_by_symbol: Dict[str, List[OverlayPosition]] = {}
+        # Running premium total and each position's premium share. Delta is
+        # summed live since positions are revalued in place.
+        self._total_premium = 0.0
+        self._position_premiums: Dict[str, float] = {}
         self._budget: Optional[OverlayBudget] = None
         self._stress_signals: Dict[str, SovereignStressSignal] = {}
-
-        # Price history for stress detection
-        self._price_history: Dict[str, pd.Series] = {}
+        # Rendered stress_signals summary section; None when stale
+        self._signals_summary: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # Price history for stress detection (contiguous float64 closes)
+        self._price_history: Dict[str, np.ndarray] = {}
+        # (52-week high, close 20 bars back) per symbol, set on update
+        self._history_stats: Dict[str, Tuple[float, float]] = {}
+        # Last (price, thresholds, stress core) per symbol, cleared on history update
+        self._stress_cache: Dict[
+            str, Tuple[float, Tuple[float, float, float], Tuple[float, str, float, StressLevel]]
+        ] = {}
 
         # Last update
         self._last_update: Optional[datetime] = None
 
+    def _add_position(self, position: OverlayPosition) -> None:
+        """
+        Track a position, keeping the symbol index and premium total in sync.
+
+        Premium paid is read here, so re-add a position (same position_id)
+        after changing it rather than mutating it.
+        """
+        if position.position_id in self._positions:
+            self._remove_position(position.position_id)
+        self._positions[position.position_id] = position
+        self._positions_by_symbol.setdefault(position.proxy.symbol, []).append(position)
+
+        self._position_premiums[position.position_id] = position.premium_paid
+        self._total_premium += position.premium_paid
+
+    def _remove_position(self, position_id: str) -> OverlayPosition:
+        """Stop tracking a position and return it."""
+        position = self._positions.pop(position_id)
+        symbol_positions = self._positions_by_symbol[position.proxy.symbol]
+        symbol_positions.remove(position)
+        if not symbol_positions:
+            del self._positions_by_symbol[position.proxy.symbol]
+
+        premium = self._position_premiums.pop(position_id)
+        if self._positions:
+            self._total_premium -= premium
+        else:
+            # Reset rather than leave subtraction rounding on an empty book
+            self._total_premium = 0.0
+        return position
+
     def initialize_budget(
         self,
         nav: float,
@@ -339,12 +500,89 @@ class SovereignCrisisOverlay:
             symbol: ETF symbol (EWI, EWQ, FXE, EUFN)
             prices: Price series
         """
-        self._price_history[symbol] = prices
+        arr = np.ascontiguousarray(prices, dtype=np.float64)
+        self._price_history[symbol] = arr
+
+        # Window reductions only change when the history does, so take
+        # them here rather than on every stress signal
+        if arr.size >= 20:
+            # fmax skips NaN like Series.max
+            self._history_stats[symbol] = (np.fmax.reduce(arr[-252:]), arr[-20])
+        else:
+            self._history_stats.pop(symbol, None)
+        self._stress_cache.pop(symbol, None)
+
+    def update_price_histories(self, histories: Dict[str, pd.Series]) -> None:
+        """
+        Update price histories for several proxies at once.
+
+        Equivalent to calling update_price_history per symbol, but the
+        52-week highs are reduced in one pass over a stacked window.
+
+        Args:
+            histories: Mapping of ETF symbol to price series
+        """
+        arrays = {
+            symbol: np.ascontiguousarray(prices, dtype=np.float64)
+            for symbol, prices in histories.items()
+        }
+        self._price_history.update(arrays)
+
+        scored = [symbol for symbol, arr in arrays.items() if arr.size >= 20]
+        if scored:
+            highs, lags = _window_stats([arrays[symbol] for symbol in scored])
+            for i, symbol in enumerate(scored):
+                self._history_stats[symbol] = (highs[i], lags[i])
+
+        for symbol, arr in arrays.items():
+            if arr.size < 20:
+                self._history_stats.pop(symbol, None)
+            self._stress_cache.pop(symbol, None)
+
+    def _price_cache_file(self, path: Optional[str]) -> Path:
+        """Resolve an explicit cache path or fall back to the configured one."""
+        path = path or self.config.price_cache_path
+        if path is None:
+            raise ValueError("No price cache path given or configured")
+        return Path(path)
+
+    def save_price_cache(self, path: Optional[str] = None) -> None:
+        """
+        Write all proxy price histories to a single .npz file.
+
+        Args:
+            path: Cache file (defaults to config.price_cache_path)
+        """
+        cache_file = self._price_cache_file(path)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write through a handle so numpy does not append its own suffix
+        with open(cache_file, 'wb') as f:
+            np.savez(f, **self._price_history)
+
+    def load_price_cache(self, path: Optional[str] = None) -> int:
+        """
+        Restore proxy price histories saved by save_price_cache.
+
+        Args:
+            path: Cache file (defaults to config.price_cache_path)
+
+        Returns:
+            Number of symbols loaded (0 if the file does not exist)
+        """
+        cache_file = self._price_cache_file(path)
+        if not cache_file.exists():
+            return 0
+
+        with np.load(cache_file) as cached:
+            self.update_price_histories({symbol: cached[symbol] for symbol in cached.files})
+            return len(cached.files)
 
     def compute_stress_signal(
         self,
         proxy_key: str,
-        current_price: float
+        current_price: float,
+        today: Optional[date] = None
     ) -> SovereignStressSignal:
         """
         Compute stress signal for a sovereign proxy.
@@ -352,6 +590,7 @@ class SovereignCrisisOverlay:
         Args:
             proxy_key: Key in SOVEREIGN_PROXIES
             current_price: Current price of proxy
+            today: Current date for position expiry checks
 
         Returns:
             SovereignStressSignal with stress level and action
@@ -360,11 +599,11 @@ class SovereignCrisisOverlay:
         if proxy is None:
             raise ValueError(f"Unknown proxy: {proxy_key}")
 
-        # Get price history
-        prices = self._price_history.get(proxy.symbol)
+        # Get price history stats
+        stats = self._history_stats.get(proxy.symbol)
 
         # Default if no history
-        if prices is None or len(prices) < 20:
+        if stats is None:
             return SovereignStressSignal(
                 country=proxy.country,
                 stress_level=StressLevel.LOW,
@@ -375,38 +614,21 @@ class SovereignCrisisOverlay:
                 commentary="Insufficient price history"
             )
 
-        # Compute drawdown from high
-        high_52w = prices.tail(252).max() if len(prices) >= 252 else prices.max()
-        drawdown = (current_price - high_52w) / high_52w
-
-        # Compute trend (20-day momentum)
-        if len(prices) >= 20:
-            momentum_20d = (current_price - prices.iloc[-20]) / prices.iloc[-20]
-            if momentum_20d < -0.05:
-                trend = "widening"
-            elif momentum_20d > 0.03:
-                trend = "tightening"
-            else:
-                trend = "stable"
+        # Feeds often repeat the last price between history updates; the
+        # thresholds are part of the key so config changes take effect
+        thresholds = self._stress_thresholds()
+        cached = self._stress_cache.get(proxy.symbol)
+        if cached is not None and cached[0] == current_price and cached[1] == thresholds:
+            drawdown, trend, stress_score, stress_level = cached[2]
         else:
-            momentum_20d = 0.0
-            trend = "stable"
-
-        # Compute stress score (0 to 1)
-        stress_score = min(1.0, max(0.0, -drawdown / 0.50))
-
-        # Determine stress level
-        if -drawdown >= self.config.stress_threshold_crisis:
-            stress_level = StressLevel.CRISIS
-        elif -drawdown >= self.config.stress_threshold_high:
-            stress_level = StressLevel.HIGH
-        elif -drawdown >= self.config.stress_threshold_elevated:
-            stress_level = StressLevel.ELEVATED
-        else:
-            stress_level = StressLevel.LOW
+            core = self._stress_core(stats, current_price, thresholds)
+            self._stress_cache[proxy.symbol] = (current_price, thresholds, core)
+            drawdown, trend, stress_score, stress_level = core
 
         # Determine action
-        action = self._determine_action(stress_level, trend, proxy_key)
+        action = self._determine_action(
+            stress_level, trend, proxy_key, today or date.today()
+        )
 
         # Commentary
         commentary = self._build_commentary(
@@ -424,20 +646,79 @@ class SovereignCrisisOverlay:
         )
 
         self._stress_signals[proxy_key] = signal
+        self._signals_summary = None
         return signal
 
+    def _stress_thresholds(self) -> Tuple[float, float, float]:
+        """
+        Drawdown cut-offs for ELEVATED, HIGH, CRISIS from the current config.
+
+        Each is capped by the more severe ones so the tuple is sorted and
+        bisect_right matches the most-severe-first >= ladder for any config.
+
+        Returns:
+            Tuple of (elevated, high, crisis) drawdown thresholds
+        """
+        crisis = self.config.stress_threshold_crisis
+        high = min(self.config.stress_threshold_high, crisis)
+        elevated = min(self.config.stress_threshold_elevated, high)
+        return elevated, high, crisis
+
+    def _stress_core(
+        self,
+        stats: Tuple[float, float],
+        current_price: float,
+        thresholds: Tuple[float, float, float]
+    ) -> Tuple[float, str, float, StressLevel]:
+        """
+        Compute the price-only part of a stress signal.
+
+        Args:
+            stats: (52-week high, close 20 bars back) for the proxy
+            current_price: Current price of proxy
+            thresholds: Sorted (elevated, high, crisis) drawdown thresholds
+
+        Returns:
+            Tuple of (drawdown, trend, stress score, stress level)
+        """
+        high_52w, lagged = stats
+
+        # Compute drawdown from high
+        drawdown = (current_price - high_52w) / high_52w
+
+        # Compute trend (20-day momentum)
+        momentum_20d = (current_price - lagged) / lagged
+        if momentum_20d < -0.05:
+            trend = "widening"
+        elif momentum_20d > 0.03:
+            trend = "tightening"
+        else:
+            trend = "stable"
+
+        # Compute stress score (0 to 1)
+        stress_score = min(1.0, max(0.0, -drawdown / 0.50))
+
+        # Determine stress level (NaN would bisect past every threshold)
+        if drawdown == drawdown:
+            stress_level = _STRESS_LEVELS[bisect_right(thresholds, -drawdown)]
+        else:
+            stress_level = StressLevel.LOW
+
+        return drawdown, trend, stress_score, stress_level
+
     def _determine_action(
         self,
         stress_level: StressLevel,
         trend: str,
-        proxy_key: str
+        proxy_key: str,
+        today: date
     ) -> OverlayAction:
         """Determine overlay action based on stress and trend."""
         # Check existing coverage
+        min_dte_roll = self.config.min_dte_roll
         has_position = any(
-            p.proxy.symbol == SOVEREIGN_PROXIES[proxy_key].symbol
-            for p in self._positions.values()
-            if p.days_to_expiry > self.config.min_dte_roll
+            p.days_to_expiry(today) > min_dte_roll
+            for p in self._positions_by_symbol.get(SOVEREIGN_PROXIES[proxy_key].symbol, ())
         )
 
         if stress_level == StressLevel.CRISIS:
@@ -476,8 +757,8 @@ class SovereignCrisisOverlay:
         """Build commentary for stress signal."""
         return (
             f"{proxy.description} ({proxy.symbol}): "
-            f"Stress={stress_level.value}, Drawdown={drawdown:.1%}, "
-            f"Trend={trend}, Action={action.value}"
+            f"Stress={stress_level.level_str}, Drawdown={drawdown:.1%}, "
+            f"Trend={trend}, Action={action.action_str}"
         )
 
     def ensure_overlay_coverage(
@@ -511,11 +792,34 @@ class SovereignCrisisOverlay:
             logger.warning("Sovereign overlay budget exhausted")
             return orders
 
+        # One feed round-trip for all proxies when the feed supports it;
+        # anything but a dict (e.g. a duck-typed feed) falls back per symbol
+        batch_prices = None
+        if hasattr(data_feed, 'get_prices_batch'):
+            try:
+                batch_prices = data_feed.get_prices_batch(list(self._proxy_symbols))
+            except Exception as e:
+                logger.debug("Batch price fetch failed, falling back: %s", e)
+            if not isinstance(batch_prices, dict):
+                batch_prices = None
+
         # Update stress signals for each proxy
-        for proxy_key, proxy in SOVEREIGN_PROXIES.items():
+        get_last_price = data_feed.get_last_price
+        for proxy_key, proxy in self._proxy_items:
+            # A batch miss is an expected outcome, not an error: skip the
+            # proxy directly instead of raising into the handler below
+            if batch_prices is not None:
+                current_price = batch_prices.get(proxy.symbol)
+                if current_price is None:
+                    logger.debug("Failed to process %s: no price for %s", proxy_key, proxy.symbol)
+                    continue
+
             try:
-                current_price = data_feed.get_last_price(proxy.symbol)
-                signal = self.compute_stress_signal(proxy_key, current_price)
+                if batch_prices is None:
+                    current_price = get_last_price(proxy.symbol)
+                signal = self.compute_stress_signal(proxy_key, current_price, today)
+                if signal.action == OverlayAction.HOLD:
+                    continue
 
                 # Generate orders based on signal
                 proxy_orders = self._generate_orders_for_signal(
@@ -524,7 +828,7 @@ class SovereignCrisisOverlay:
                 orders.extend(proxy_orders)
 
             except Exception as e:
-                logger.debug(f"Failed to process {proxy_key}: {e}")
+                logger.debug("Failed to process %s: %s", proxy_key, e)
 
         # Check and roll expiring positions
         roll_orders = self._check_and_roll_positions(data_feed, today)
@@ -543,6 +847,7 @@ class SovereignCrisisOverlay:
         """Generate orders based on stress signal."""
         orders = []
 
+        # HOLD is filtered out by ensure_overlay_coverage; kept for direct callers
         if signal.action == OverlayAction.HOLD:
             return orders
 
@@ -588,34 +893,28 @@ class SovereignCrisisOverlay:
         """
         orders = []
 
-        if self._budget is None or self._budget.remaining <= 0:
+        if self._budget is None:
+            return orders
+
+        # The single-country cap bounds the position budget, so check it
+        # (and the remaining budget) before any per-proxy lookups
+        remaining = self._budget.remaining
+        country_cap = remaining * self.config.max_single_country_pct
+        if remaining <= 0 or country_cap < 100:  # Minimum $100 per position
             return orders
 
         # Get budget allocation for this proxy
-        allocation_key = proxy.symbol.lower()
-        if allocation_key == "ewi":
-            allocation_key = "italy"
-        elif allocation_key == "ewq":
-            allocation_key = "france"
-        elif allocation_key == "fxe":
-            allocation_key = "eur_usd"
-        elif allocation_key == "eufn":
-            allocation_key = "eu_banks"
-
-        allocation = self.config.country_allocations.get(allocation_key, 0.20)
+        allocation = self.config.country_allocations.get(proxy.allocation_key, 0.20)
 
         # Calculate budget for this position
-        position_budget = min(
-            self._budget.remaining * allocation * size_multiplier,
-            self._budget.remaining * self.config.max_single_country_pct
-        )
+        position_budget = min(remaining * allocation * size_multiplier, country_cap)
 
         if position_budget < 100:  # Minimum $100 per position
             return orders
 
         # Calculate strikes
-        long_strike = round(current_price * (1 - proxy.otm_pct), 1)
-        short_strike = round(current_price * (1 - proxy.otm_pct - proxy.spread_width), 1)
+        long_strike = round(current_price * proxy.long_strike_factor, 1)
+        short_strike = round(current_price * proxy.short_strike_factor, 1)
 
         # Estimate premium (rough: ~2-4% for OTM puts)
         est_spread_premium = current_price * 0.015  # ~1.5% for spread
@@ -630,31 +929,23 @@ class SovereignCrisisOverlay:
 
         if contracts > 0:
             # Buy long put (lower strike)
-            orders.append(OrderSpec(
-                instrument_id=f"{proxy.symbol}_put_{long_strike}",
-                side="BUY",
-                quantity=contracts,
-                order_type="LMT",
+            orders.append(_overlay_order(
+                f"{proxy.symbol}_put_{long_strike}", "BUY", contracts, "LMT",
+                f"Sovereign overlay: Buy {proxy.symbol} {long_strike} Put",
                 limit_price=est_spread_premium * 0.6,  # Long leg
-                sleeve=Sleeve.EUROPE_VOL_CONVEX,
-                reason=f"Sovereign overlay: Buy {proxy.symbol} {long_strike} Put"
             ))
 
             if self.config.use_spreads:
                 # Sell short put (even lower strike)
-                orders.append(OrderSpec(
-                    instrument_id=f"{proxy.symbol}_put_{short_strike}",
-                    side="SELL",
-                    quantity=contracts,
-                    order_type="LMT",
+                orders.append(_overlay_order(
+                    f"{proxy.symbol}_put_{short_strike}", "SELL", contracts, "LMT",
+                    f"Sovereign overlay: Sell {proxy.symbol} {short_strike} Put",
                     limit_price=est_spread_premium * 0.4,  # Short leg
-                    sleeve=Sleeve.EUROPE_VOL_CONVEX,
-                    reason=f"Sovereign overlay: Sell {proxy.symbol} {short_strike} Put"
                 ))
 
             logger.info(
-                f"Sovereign overlay: {proxy.symbol} {long_strike}/{short_strike} "
-                f"put spread x{contracts}, budget ${position_budget:.0f}"
+                "Sovereign overlay: %s %s/%s put spread x%d, budget $%.0f",
+                proxy.symbol, long_strike, short_strike, contracts, position_budget
             )
 
         return orders
@@ -666,35 +957,24 @@ class SovereignCrisisOverlay:
         """Create orders to close profitable positions."""
         orders = []
 
-        for pos_id, pos in list(self._positions.items()):
-            if pos.proxy.symbol != proxy.symbol:
-                continue
-
+        for pos in list(self._positions_by_symbol.get(proxy.symbol, ())):
             # Only monetize profitable positions
             if pos.pnl <= 0:
                 continue
 
             # Close long leg
-            orders.append(OrderSpec(
-                instrument_id=f"{proxy.symbol}_put_{pos.long_strike}",
-                side="SELL",
-                quantity=pos.quantity,
-                order_type="MKT",
-                sleeve=Sleeve.EUROPE_VOL_CONVEX,
+            orders.append(_overlay_order(
+                f"{proxy.symbol}_put_{pos.long_strike}", "SELL", pos.quantity, "MKT",
+                f"Monetize: {proxy.symbol} put, PnL ${pos.pnl:.0f}",
                 urgency="urgent",
-                reason=f"Monetize: {proxy.symbol} put, PnL ${pos.pnl:.0f}"
             ))
 
             if pos.short_strike:
                 # Close short leg
-                orders.append(OrderSpec(
-                    instrument_id=f"{proxy.symbol}_put_{pos.short_strike}",
-                    side="BUY",
-                    quantity=pos.quantity,
-                    order_type="MKT",
-                    sleeve=Sleeve.EUROPE_VOL_CONVEX,
+                orders.append(_overlay_order(
+                    f"{proxy.symbol}_put_{pos.short_strike}", "BUY", pos.quantity, "MKT",
+                    f"Monetize: Close {proxy.symbol} short put",
                     urgency="urgent",
-                    reason=f"Monetize: Close {proxy.symbol} short put"
                 ))
 
             # Record realized gain
@@ -702,11 +982,9 @@ class SovereignCrisisOverlay:
                 self._budget.realized_gains_ytd += pos.pnl
 
             # Remove position
-            del self._positions[pos_id]
+            self._remove_position(pos.position_id)
 
-            logger.info(
-                f"Monetized {proxy.symbol} position: PnL ${pos.pnl:.0f}"
-            )
+            logger.info("Monetized %s position: PnL $%.0f", proxy.symbol, pos.pnl)
 
         return orders
 
@@ -719,25 +997,17 @@ class SovereignCrisisOverlay:
         orders = []
 
         for pos_id, pos in list(self._positions.items()):
-            if pos.days_to_expiry <= self.config.min_dte_roll:
+            if pos.days_to_expiry(today) <= self.config.min_dte_roll:
                 # Close current position
-                orders.append(OrderSpec(
-                    instrument_id=f"{pos.proxy.symbol}_put_{pos.long_strike}",
-                    side="SELL",
-                    quantity=pos.quantity,
-                    order_type="MKT",
-                    sleeve=Sleeve.EUROPE_VOL_CONVEX,
-                    reason=f"Roll: Close expiring {pos.proxy.symbol} put"
+                orders.append(_overlay_order(
+                    f"{pos.proxy.symbol}_put_{pos.long_strike}", "SELL", pos.quantity, "MKT",
+                    f"Roll: Close expiring {pos.proxy.symbol} put",
                 ))
 
                 if pos.short_strike:
-                    orders.append(OrderSpec(
-                        instrument_id=f"{pos.proxy.symbol}_put_{pos.short_strike}",
-                        side="BUY",
-                        quantity=pos.quantity,
-                        order_type="MKT",
-                        sleeve=Sleeve.EUROPE_VOL_CONVEX,
-                        reason=f"Roll: Close expiring {pos.proxy.symbol} short put"
+                    orders.append(_overlay_order(
+                        f"{pos.proxy.symbol}_put_{pos.short_strike}", "BUY", pos.quantity, "MKT",
+                        f"Roll: Close expiring {pos.proxy.symbol} short put",
                     ))
 
                 # Create new position with further expiry
@@ -748,15 +1018,34 @@ class SovereignCrisisOverlay:
                     )
                     orders.extend(roll_orders)
                 except Exception as e:
-                    logger.warning(f"Failed to roll {pos.proxy.symbol}: {e}")
+                    logger.warning("Failed to roll %s: %s", pos.proxy.symbol, e)
 
                 # Remove old position
-                del self._positions[pos_id]
+                self._remove_position(pos_id)
 
         return orders
 
     def get_summary(self) -> Dict[str, Any]:
-        """Get summary of overlay state."""
+        """
+        Get summary of overlay state.
+
+        The stress_signals section is cached until the next signal is
+        computed and is shared between calls, so treat it as read-only.
+        """
+        signals_summary = self._signals_summary
+        if signals_summary is None:
+            signals_summary = self._signals_summary = {
+                key: {
+                    "country": sig.country.value,
+                    "level": sig.stress_level.level_str,
+                    "score": round(sig.stress_score, 3),
+                    "trend": sig.trend,
+                    "action": sig.action.action_str,
+                }
+                for key, sig in self._stress_signals.items()
+            }
+
+        today = date.today()
         return {
             "positions": {
                 pos_id: {
@@ -764,23 +1053,14 @@ class SovereignCrisisOverlay:
                     "structure": pos.structure,
                     "quantity": pos.quantity,
                     "strikes": f"{pos.long_strike}/{pos.short_strike or 'naked'}",
-                    "dte": pos.days_to_expiry,
+                    "dte": pos.days_to_expiry(today),
                     "premium_paid": pos.premium_paid,
                     "current_value": pos.current_value,
                     "pnl": pos.pnl,
                 }
                 for pos_id, pos in self._positions.items()
             },
-            "stress_signals": {
-                key: {
-                    "country": sig.country.value,
-                    "level": sig.stress_level.value,
-                    "score": round(sig.stress_score, 3),
-                    "trend": sig.trend,
-                    "action": sig.action.value,
-                }
-                for key, sig in self._stress_signals.items()
-            },
+            "stress_signals": signals_summary,
             "budget": {
                 "annual": self._budget.total_budget if self._budget else 0,
                 "used_ytd": self._budget.used_ytd if self._budget else 0,
@@ -801,4 +1081,4 @@ class SovereignCrisisOverlay:
 
     def get_total_premium_at_risk(self) -> float:
         """Get total premium paid (max loss)."""
-        return sum(pos.premium_paid for pos in self._positions.values())
+        return self._total_premium
@@ -17,12 +17,15 @@ deflation guard completely exits in risk-off + rates-down scenarios.
 """
 
 import logging
+import math
 import numpy as np
 import pandas as pd
+from collections import deque
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Deque
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
 from .portfolio import PortfolioState, Sleeve
 from .strategy_logic import OrderSpec
@@ -30,6 +33,54 @@ from .risk_engine import RiskRegime
 
 logger = logging.getLogger(__name__)
 
+# Trading days of yield history retained for signal calculation
+HISTORY_DAYS = 300
+
+# Updates between full rebuilds of the running spread z-score sums
+SPREAD_STATS_REBUILD_TICKS = 1000
+
+# SizingResult.reason template for the sized (non-kill) path
+_SIZING_REASON_FORMAT = (
+    "regime=%s; base=%.2f%%; frag_mult=%.1f (z=%.2f); rates_mult=%.1f (bund_60d=%.0fbps)"
+)
+
+# Default regime weights and futures DV01s (copied into each config)
+_DEFAULT_BASE_WEIGHTS = MappingProxyType({"normal": 0.06, "elevated": 0.12, "crisis": 0.16})
+_DEFAULT_MAX_WEIGHTS = MappingProxyType({"normal": 0.10, "elevated": 0.16, "crisis": 0.20})
+_DEFAULT_DV01_PER_CONTRACT = MappingProxyType({"FGBL": 80.0, "FBTP": 78.0, "FOAT": 79.0})
+
+# Lowercase config key for each regime (e.g. RiskRegime.NORMAL -> "normal")
+_REGIME_LOWER = MappingProxyType({r: r.value.lower() for r in RiskRegime})
+
+# Deflation scaler by tier (0 = no tier triggered, 3 = most severe)
+DEFLATION_TIER_SCALERS = np.array([1.0, 0.5, 0.25, 0.0])
+
+# Record layout returned by compute_fragmentation_signal_batch
+SIGNAL_BATCH_DTYPE = np.dtype([
+    ("spread_bps", np.float64),
+    ("spread_z", np.float64),
+    ("spread_mom_20d", np.float64),
+    ("bund_yield_mom_60d", np.float64),
+    ("bund_yield_change_5d", np.float64),
+    ("bund_yield_mom_20d", np.float64),
+    ("vix_level", np.float64),
+    ("stress_score", np.float64),
+])
+
+
+def _trailing_change(values: np.ndarray, periods: int) -> np.ndarray:
+    """
+    Change over a trailing window that includes the current observation.
+
+    Matches ``current - history.iloc[-periods]`` once ``periods`` observations
+    exist; earlier rows are zero.
+    """
+    out = np.zeros_like(values)
+    lag = periods - 1
+    if values.size > lag:
+        out[lag:] = values[lag:] - values[:values.size - lag]
+    return out
+
 
 class KillSwitchType(Enum):
     """Kill-switch trigger types."""
@@ -46,7 +97,7 @@ class SleeveState(Enum):
     REENABLE_PENDING = "reenable_pending"
 
 
-@dataclass
+@dataclass(slots=True)
 class FragmentationSignal:
     """Fragmentation signal output."""
     spread_bps: float           # BTP-Bund spread in bps
@@ -57,7 +108,12 @@ class FragmentationSignal:
     bund_yield_mom_20d: float   # 20-day change in Bund yield (bps)
     vix_level: float
     stress_score: float
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: Optional[datetime] = None  # Set by callers that track time
+
+    @property
+    def timestamp_or_now(self) -> datetime:
+        """Signal timestamp, falling back to the current wall-clock time."""
+        return self.timestamp or datetime.now()
 
     @property
     def risk_off(self) -> bool:
@@ -75,7 +131,7 @@ class FragmentationSignal:
         return self.risk_off and self.rates_down_shock
 
 
-@dataclass
+@dataclass(slots=True)
 class DeflationScalerTier:
     """Configuration for a single deflation scaler tier."""
     vix_threshold: float
@@ -83,7 +139,7 @@ class DeflationScalerTier:
     scaler: float  # 0.0, 0.25, 0.5, 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SizingResult:
     """Position sizing output."""
     target_weight: float
@@ -95,10 +151,16 @@ class SizingResult:
     deflation_guard: bool  # Legacy: kept for compatibility
     soft_kill: bool
     regime: RiskRegime
-    reason: str
+    reason_format: str  # %-style template, rendered by ``reason``
+    reason_args: Tuple[Any, ...] = ()
 
+    @property
+    def reason(self) -> str:
+        """Human-readable sizing rationale (formatted only when read)."""
+        return self.reason_format % self.reason_args
 
-@dataclass
+
+@dataclass(slots=True)
 class DV01Position:
     """DV01-neutral position specification."""
     btp_contracts: int          # Short contracts (negative = short)
@@ -116,7 +178,7 @@ class DV01Position:
         return abs(self.actual_net_dv01) < abs(self.target_dv01) * 0.05
 
 
-@dataclass
+@dataclass(slots=True)
 class SleeveTracker:
     """Tracks sleeve state for kill-switch and re-enable logic."""
     state: SleeveState = SleeveState.ACTIVE
@@ -125,19 +187,28 @@ class SleeveTracker:
     entry_date: Optional[date] = None
     last_profit_take_date: Optional[date] = None
     cumulative_pnl: float = 0.0
-    daily_pnl_history: List[float] = field(default_factory=list)
+    daily_pnl_history: Deque[float] = field(default_factory=lambda: deque(maxlen=10))
+
+    # Running sum of daily_pnl_history, re-summed each full turnover
+    _rolling_10d_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _pnl_updates: int = field(default=0, init=False, repr=False, compare=False)
 
     def update_daily_pnl(self, pnl: float) -> None:
         """Update daily P&L history (keep last 10 days)."""
-        self.daily_pnl_history.append(pnl)
-        if len(self.daily_pnl_history) > 10:
-            self.daily_pnl_history = self.daily_pnl_history[-10:]
+        history = self.daily_pnl_history
+        evicted = history[0] if len(history) == history.maxlen else 0.0
+        history.append(pnl)
+        self._pnl_updates += 1
+        if self._pnl_updates % history.maxlen == 0:
+            self._rolling_10d_sum = sum(history)
+        else:
+            self._rolling_10d_sum += pnl - evicted
         self.cumulative_pnl += pnl
 
     @property
     def rolling_10d_pnl(self) -> float:
         """Get rolling 10-day P&L."""
-        return sum(self.daily_pnl_history)
+        return self._rolling_10d_sum
 
 
 @dataclass
@@ -147,16 +218,8 @@ class SovereignRatesShortConfig:
     target_weight_pct: float = 0.12
 
     # Regime-based weights
-    base_weights: Dict[str, float] = field(default_factory=lambda: {
-        "normal": 0.06,
-        "elevated": 0.12,
-        "crisis": 0.16,
-    })
-    max_weights: Dict[str, float] = field(default_factory=lambda: {
-        "normal": 0.10,
-        "elevated": 0.16,
-        "crisis": 0.20,
-    })
+    base_weights: Dict[str, float] = field(default_factory=lambda: dict(_DEFAULT_BASE_WEIGHTS))
+    max_weights: Dict[str, float] = field(default_factory=lambda: dict(_DEFAULT_MAX_WEIGHTS))
 
     # DV01 budget
     dv01_budget_per_nav: float = 0.0007  # 7bps of NAV per 100bp move
@@ -215,11 +278,17 @@ class SovereignRatesShortConfig:
     recycle_wait_days: int = 3
 
     # DV01 per contract (monthly calibration)
-    dv01_per_contract: Dict[str, float] = field(default_factory=lambda: {
-        "FGBL": 80.0,
-        "FBTP": 78.0,
-        "FOAT": 79.0,
-    })
+    dv01_per_contract: Dict[str, float] = field(
+        default_factory=lambda: dict(_DEFAULT_DV01_PER_CONTRACT)
+    )
+
+    def regime_weights(self, regime: RiskRegime) -> Tuple[float, float]:
+        """Return the (base, max) target weight for a regime."""
+        regime_key = _REGIME_LOWER[regime]
+        return (
+            self.base_weights.get(regime_key, 0.10),
+            self.max_weights.get(regime_key, 0.12),
+        )
 
     @classmethod
     def from_settings(cls, settings: Dict[str, Any]) -> "SovereignRatesShortConfig":
@@ -229,14 +298,16 @@ class SovereignRatesShortConfig:
         if not srs_settings:
             return cls()
 
-        # Default values for dict fields (can't use cls.field for default_factory fields)
-        default_base_weights = {'normal': 0.06, 'elevated': 0.12, 'crisis': 0.16}
-        default_max_weights = {'normal': 0.10, 'elevated': 0.16, 'crisis': 0.20}
-        default_dv01_per_contract = {'FGBL': 80.0, 'FBTP': 78.0, 'FOAT': 79.0}
-
-        base_weights = srs_settings.get('base_weights', default_base_weights)
-        max_weights = srs_settings.get('max_weights', default_max_weights)
-        dv01_per_contract = srs_settings.get('dv01_per_contract', default_dv01_per_contract)
+        # Dict fields fall back to a copy of the module defaults
+        base_weights = srs_settings.get('base_weights')
+        if not isinstance(base_weights, dict):
+            base_weights = dict(_DEFAULT_BASE_WEIGHTS)
+        max_weights = srs_settings.get('max_weights')
+        if not isinstance(max_weights, dict):
+            max_weights = dict(_DEFAULT_MAX_WEIGHTS)
+        dv01_per_contract = srs_settings.get('dv01_per_contract')
+        if not isinstance(dv01_per_contract, dict):
+            dv01_per_contract = dict(_DEFAULT_DV01_PER_CONTRACT)
 
         # Parse nested configs
         signals = srs_settings.get('signals', {})
@@ -251,8 +322,8 @@ class SovereignRatesShortConfig:
         return cls(
             enabled=srs_settings.get('enabled', True),
             target_weight_pct=srs_settings.get('target_weight_pct', 0.12),
-            base_weights=base_weights if isinstance(base_weights, dict) else default_base_weights,
-            max_weights=max_weights if isinstance(max_weights, dict) else default_max_weights,
+            base_weights=base_weights,
+            max_weights=max_weights,
             dv01_budget_per_nav=srs_settings.get('dv01_budget_per_nav', 0.0007),
             btp_symbol=instruments.get('btp', 'FBTP'),
             bund_symbol=instruments.get('bund', 'FGBL'),
@@ -287,7 +358,7 @@ class SovereignRatesShortConfig:
             take_profit_spread_widening_bps=take_profit.get('spread_widening_bps', 120.0),
             profit_take_pct=take_profit.get('profit_take_pct', 0.50),
             recycle_wait_days=take_profit.get('recycle_wait_days', 3),
-            dv01_per_contract=dv01_per_contract if isinstance(dv01_per_contract, dict) else default_dv01_per_contract,
+            dv01_per_contract=dv01_per_contract,
         )
 
 
@@ -319,10 +390,26 @@ class SovereignRatesShortEngine:
         self._last_sizing: Optional[SizingResult] = None
         self._last_position: Optional[DV01Position] = None
 
-        # Price history for signal calculation
-        self._btp_yield_history: pd.Series = pd.Series(dtype=float)
-        self._bund_yield_history: pd.Series = pd.Series(dtype=float)
-        self._spread_history: pd.Series = pd.Series(dtype=float)
+        # Price history for signal calculation: ring buffers of the last
+        # HISTORY_DAYS observations. Slot ``seq % HISTORY_DAYS`` holds the
+        # seq-th distinct as_of date; re-sending a date overwrites its slot.
+        # BTP yields enter only through the spread, so they aren't kept.
+        self._bund_yield_history = np.empty(HISTORY_DAYS, dtype=np.float64)
+        self._spread_history = np.empty(HISTORY_DAYS, dtype=np.float64)
+        self._history_dates: List[Optional[date]] = [None] * HISTORY_DAYS
+        self._history_seq: Dict[date, int] = {}
+        self._history_total = 0  # Distinct dates ever appended
+        self._history_len = 0    # Dates currently held (<= HISTORY_DAYS)
+
+        # Running sums over the finite spreads in the z-score window, kept as
+        # deviations from an in-window anchor so a flat spread has exactly
+        # zero variance. Rebuilt from the buffer periodically to shed drift.
+        self._z_window = self._spread_z_window()
+        self._z_anchor = 0.0
+        self._z_sum = 0.0
+        self._z_sumsq = 0.0
+        self._z_count = 0
+        self._z_ticks = 0
 
     def update_yield_history(
         self,
@@ -332,17 +419,96 @@ class SovereignRatesShortEngine:
     ) -> None:
         """Update yield history for signal calculation."""
         as_of = as_of or date.today()
+        spread = (btp_yield - bund_yield) * 100  # Convert to bps
+        window = self._z_window
+
+        seq = self._history_seq.get(as_of)
+        if seq is None:
+            # New date: append, evicting the oldest once the buffer is full
+            seq = self._history_total
+            slot = seq % HISTORY_DAYS
+            if self._history_len >= window:
+                # Oldest spread leaves the z-score window
+                self._remove_spread_stat(
+                    float(self._spread_history[(seq - window) % HISTORY_DAYS])
+                )
+            evicted = self._history_dates[slot]
+            if evicted is not None:
+                del self._history_seq[evicted]
+            self._history_dates[slot] = as_of
+            self._history_seq[as_of] = seq
+            self._history_total = seq + 1
+            if self._history_len < HISTORY_DAYS:
+                self._history_len += 1
+            self._add_spread_stat(spread)
+        else:
+            slot = seq % HISTORY_DAYS
+            if seq >= self._history_total - window:
+                self._remove_spread_stat(float(self._spread_history[slot]))
+                self._add_spread_stat(spread)
+
+        self._bund_yield_history[slot] = bund_yield
+        self._spread_history[slot] = spread
+
+        self._z_ticks += 1
+        if self._z_ticks >= SPREAD_STATS_REBUILD_TICKS:
+            self._rebuild_spread_stats()
+
+    def _spread_z_window(self) -> int:
+        """Number of trailing spreads in the z-score window."""
+        lookback = self.config.spread_z_lookback_days
+        return min(lookback, HISTORY_DAYS) if lookback > 0 else HISTORY_DAYS
+
+    def _add_spread_stat(self, spread: float) -> None:
+        """Add a spread to the running z-score sums."""
+        if not math.isfinite(spread):
+            return
+        if self._z_count == 0:
+            self._z_anchor = spread
+            self._z_sum = 0.0
+            self._z_sumsq = 0.0
+        dev = spread - self._z_anchor
+        self._z_sum += dev
+        self._z_sumsq += dev * dev
+        self._z_count += 1
+
+    def _remove_spread_stat(self, spread: float) -> None:
+        """Remove a spread from the running z-score sums."""
+        if not math.isfinite(spread):
+            return
+        dev = spread - self._z_anchor
+        self._z_sum -= dev
+        self._z_sumsq -= dev * dev
+        self._z_count -= 1
+
+    def _rebuild_spread_stats(self) -> None:
+        """Recompute the running z-score sums from the spread buffer."""
+        self._z_window = self._spread_z_window()
+        self._z_ticks = 0
+        window = self._history_window(
+            self._spread_history, min(self._history_len, self._z_window)
+        )
+        window = window[np.isfinite(window)]
+        self._z_count = int(window.size)
+        if window.size:
+            self._z_anchor = float(window[0])
+            dev = window - self._z_anchor
+            self._z_sum = float(dev.sum())
+            self._z_sumsq = float(dev @ dev)
+        else:
+            self._z_anchor = self._z_sum = self._z_sumsq = 0.0
 
-        # Append to history
-        self._btp_yield_history[as_of] = btp_yield
-        self._bund_yield_history[as_of] = bund_yield
-        self._spread_history[as_of] = (btp_yield - bund_yield) * 100  # Convert to bps
+    def _history_at(self, history: np.ndarray, periods_ago: int) -> float:
+        """Return the observation ``periods_ago`` entries back (1 = latest)."""
+        return history[(self._history_total - periods_ago) % HISTORY_DAYS]
 
-        # Keep last 300 days
-        if len(self._spread_history) > 300:
-            self._spread_history = self._spread_history.iloc[-300:]
-            self._btp_yield_history = self._btp_yield_history.iloc[-300:]
-            self._bund_yield_history = self._bund_yield_history.iloc[-300:]
+    def _history_window(self, history: np.ndarray, n: int) -> np.ndarray:
+        """Return the last ``n`` observations in chronological order."""
+        end = self._history_total % HISTORY_DAYS
+        start = end - n
+        if start >= 0:
+            return history[start:end]
+        return np.concatenate((history[start:], history[:end]))
 
     def compute_fragmentation_signal(
         self,
@@ -373,39 +539,42 @@ class SovereignRatesShortEngine:
         # Current spread in bps
         spread_bps = (btp_yield - bund_yield) * 100
 
-        # Spread Z-score (252-day lookback)
-        if len(self._spread_history) >= 20:
-            lookback = min(len(self._spread_history), self.config.spread_z_lookback_days)
-            spread_mean = self._spread_history.iloc[-lookback:].mean()
-            spread_std = self._spread_history.iloc[-lookback:].std()
-            if spread_std > 0:
-                spread_z = (spread_bps - spread_mean) / spread_std
-            else:
-                spread_z = 0.0
-        else:
-            spread_z = 0.0
+        n_history = self._history_len
+        spread_history = self._spread_history
+        bund_history = self._bund_yield_history
+
+        # Spread Z-score (252-day lookback, non-finite observations skipped)
+        if self._z_window != self._spread_z_window():
+            self._rebuild_spread_stats()
+        spread_z = 0.0
+        count = self._z_count
+        if n_history >= 20 and count > 1:
+            mean_dev = self._z_sum / count
+            spread_var = (self._z_sumsq - self._z_sum * mean_dev) / (count - 1)
+            if spread_var > 0:
+                spread_z = (spread_bps - self._z_anchor - mean_dev) / math.sqrt(spread_var)
 
         # Spread momentum (20-day)
-        if len(self._spread_history) >= 20:
-            spread_mom_20d = spread_bps - self._spread_history.iloc[-20]
+        if n_history >= 20:
+            spread_mom_20d = spread_bps - self._history_at(spread_history, 20)
         else:
             spread_mom_20d = 0.0
 
         # Bund yield momentum
-        if len(self._bund_yield_history) >= 60:
-            bund_yield_mom_60d = (bund_yield - self._bund_yield_history.iloc[-60]) * 100
-        elif len(self._bund_yield_history) >= 20:
-            bund_yield_mom_60d = (bund_yield - self._bund_yield_history.iloc[-20]) * 100
+        if n_history >= 60:
+            bund_yield_mom_60d = (bund_yield - self._history_at(bund_history, 60)) * 100
+        elif n_history >= 20:
+            bund_yield_mom_60d = (bund_yield - self._history_at(bund_history, 20)) * 100
         else:
             bund_yield_mom_60d = 0.0
 
-        if len(self._bund_yield_history) >= 5:
-            bund_yield_change_5d = (bund_yield - self._bund_yield_history.iloc[-5]) * 100
+        if n_history >= 5:
+            bund_yield_change_5d = (bund_yield - self._history_at(bund_history, 5)) * 100
         else:
             bund_yield_change_5d = 0.0
 
-        if len(self._bund_yield_history) >= 20:
-            bund_yield_mom_20d = (bund_yield - self._bund_yield_history.iloc[-20]) * 100
+        if n_history >= 20:
+            bund_yield_mom_20d = (bund_yield - self._history_at(bund_history, 20)) * 100
         else:
             bund_yield_mom_20d = 0.0
 
@@ -423,38 +592,136 @@ class SovereignRatesShortEngine:
         self._last_signal = signal
         return signal
 
-    def _compute_deflation_scaler(self, signal: FragmentationSignal) -> Tuple[float, str]:
+    def compute_fragmentation_signal_batch(
+        self,
+        btp_yields: np.ndarray,
+        bund_yields: np.ndarray,
+        vix_levels: np.ndarray,
+        stress_scores: np.ndarray
+    ) -> np.recarray:
+        """
+        Compute fragmentation signals for a whole yield history in one pass.
+
+        Row ``i`` matches compute_fragmentation_signal on day ``i`` for an
+        engine fed the series one distinct date at a time from empty. The
+        engine's own yield history is left untouched.
+
+        Args:
+            btp_yields: BTP 10Y yields (percent), oldest first
+            bund_yields: Bund 10Y yields (percent), aligned with btp_yields
+            vix_levels: VIX levels per day (or a scalar)
+            stress_scores: Stress scores per day (or a scalar)
+
+        Returns:
+            Record array with SIGNAL_BATCH_DTYPE fields, one row per day
+        """
+        btp = np.asarray(btp_yields, dtype=np.float64)
+        bund = np.asarray(bund_yields, dtype=np.float64)
+        spread = (btp - bund) * 100
+
+        signals = np.zeros(spread.size, dtype=SIGNAL_BATCH_DTYPE).view(np.recarray)
+        signals.spread_bps = spread
+        signals.vix_level = vix_levels
+        signals.stress_score = stress_scores
+
+        # Spread Z-score over the trailing window, non-finite spreads skipped
+        rolling = pd.Series(np.where(np.isfinite(spread), spread, np.nan)).rolling(
+            self._spread_z_window(), min_periods=2
+        )
+        spread_mean = rolling.mean().to_numpy()
+        spread_std = rolling.std().to_numpy()
+        has_z = spread_std > 0
+        has_z[:19] = False
+        with np.errstate(divide="ignore", invalid="ignore"):
+            signals.spread_z = np.where(has_z, (spread - spread_mean) / spread_std, 0.0)
+
+        signals.spread_mom_20d = _trailing_change(spread, 20)
+
+        bund_mom_20d = _trailing_change(bund, 20) * 100
+        signals.bund_yield_mom_20d = bund_mom_20d
+        signals.bund_yield_change_5d = _trailing_change(bund, 5) * 100
+        bund_mom_60d = _trailing_change(bund, 60) * 100
+        bund_mom_60d[:59] = bund_mom_20d[:59]
+        signals.bund_yield_mom_60d = bund_mom_60d
+
+        return signals
+
+    def _compute_deflation_scaler(
+        self,
+        signal: FragmentationSignal
+    ) -> Tuple[float, str, Tuple[Any, ...]]:
         """
         Compute 3-tier deflation scaler (v3.0).
 
         Returns:
-            Tuple of (scaler, reason)
+            Tuple of (scaler, reason_format, reason_args)
             scaler: 1.0 (no scaling), 0.5 (tier1), 0.25 (tier2), 0.0 (tier3)
+            reason_format % reason_args gives the reason text
         """
-        if not self.config.deflation_scaler_enabled:
-            return 1.0, "deflation_scaler disabled"
+        cfg = self.config
+        if not cfg.deflation_scaler_enabled:
+            return 1.0, "deflation_scaler disabled", ()
 
         # Fragmentation bypass: if spread is widening, keep full position
         # Rationale: fragmentation = stress, we WANT the position
-        if signal.spread_z >= self.config.deflation_fragmentation_bypass_z:
-            return 1.0, f"frag_bypass (z={signal.spread_z:.2f} >= {self.config.deflation_fragmentation_bypass_z})"
+        spread_z = signal.spread_z
+        if spread_z >= cfg.deflation_fragmentation_bypass_z:
+            return 1.0, "frag_bypass (z=%.2f >= %s)", (
+                spread_z, cfg.deflation_fragmentation_bypass_z
+            )
 
         vix = signal.vix_level
         bund_5d = signal.bund_yield_change_5d
 
         # Tier 3 (0.0x): VIX >= 55 AND bund yield -60bps/5d
-        if vix >= self.config.deflation_tier3_vix and bund_5d <= self.config.deflation_tier3_bund_5d_bps:
-            return 0.0, f"tier3_kill (VIX={vix:.0f}, bund_5d={bund_5d:.0f}bps)"
+        if vix >= cfg.deflation_tier3_vix and bund_5d <= cfg.deflation_tier3_bund_5d_bps:
+            return 0.0, "tier3_kill (VIX=%.0f, bund_5d=%.0fbps)", (vix, bund_5d)
 
         # Tier 2 (0.25x): VIX >= 45 AND bund yield -40bps/5d
-        if vix >= self.config.deflation_tier2_vix and bund_5d <= self.config.deflation_tier2_bund_5d_bps:
-            return 0.25, f"tier2 (VIX={vix:.0f}, bund_5d={bund_5d:.0f}bps)"
+        if vix >= cfg.deflation_tier2_vix and bund_5d <= cfg.deflation_tier2_bund_5d_bps:
+            return 0.25, "tier2 (VIX=%.0f, bund_5d=%.0fbps)", (vix, bund_5d)
 
         # Tier 1 (0.5x): VIX >= 35 AND bund yield -30bps/5d
-        if vix >= self.config.deflation_tier1_vix and bund_5d <= self.config.deflation_tier1_bund_5d_bps:
-            return 0.5, f"tier1 (VIX={vix:.0f}, bund_5d={bund_5d:.0f}bps)"
+        if vix >= cfg.deflation_tier1_vix and bund_5d <= cfg.deflation_tier1_bund_5d_bps:
+            return 0.5, "tier1 (VIX=%.0f, bund_5d=%.0fbps)", (vix, bund_5d)
+
+        return 1.0, "no_deflation", ()
+
+    def compute_deflation_scaler_batch(self, signals: np.recarray) -> np.ndarray:
+        """
+        Compute the 3-tier deflation scaler for a batch of signals.
 
-        return 1.0, "no_deflation"
+        Vectorized form of _compute_deflation_scaler: each row takes the scaler
+        of the most severe tier whose VIX and Bund thresholds both hold, unless
+        the fragmentation bypass applies.
+
+        Args:
+            signals: Record array from compute_fragmentation_signal_batch
+
+        Returns:
+            Array of scalers (1.0, 0.5, 0.25 or 0.0), one per row
+        """
+        cfg = self.config
+        if not cfg.deflation_scaler_enabled:
+            return np.ones(len(signals))
+
+        vix_thresholds = np.array([
+            cfg.deflation_tier1_vix, cfg.deflation_tier2_vix, cfg.deflation_tier3_vix,
+        ])
+        bund_thresholds = np.array([
+            cfg.deflation_tier1_bund_5d_bps,
+            cfg.deflation_tier2_bund_5d_bps,
+            cfg.deflation_tier3_bund_5d_bps,
+        ])
+        # (rows, tiers) trigger matrix; the highest triggered tier wins
+        triggered = (
+            (signals.vix_level[:, None] >= vix_thresholds)
+            & (signals.bund_yield_change_5d[:, None] <= bund_thresholds)
+        )
+        tier = (triggered * np.arange(1, 4)).max(axis=1, initial=0)
+        scalers = DEFLATION_TIER_SCALERS[tier]
+        scalers[signals.spread_z >= cfg.deflation_fragmentation_bypass_z] = 1.0
+        return scalers
 
     def compute_target_weight(
         self,
@@ -479,13 +746,16 @@ class SovereignRatesShortEngine:
         Returns:
             SizingResult with target weight and reasoning
         """
+        cfg = self.config
+        spread_z = signal.spread_z
+        bund_mom_60d = signal.bund_yield_mom_60d
+
         # Get base weight for regime
-        regime_key = regime.value.lower()
-        base_w = self.config.base_weights.get(regime_key, 0.10)
-        max_w = self.config.max_weights.get(regime_key, 0.12)
+        regime_key = _REGIME_LOWER[regime]
+        base_w, max_w = cfg.regime_weights(regime)
 
         # Compute 3-tier deflation scaler (v3.0)
-        deflation_scaler, deflation_reason = self._compute_deflation_scaler(signal)
+        deflation_scaler, deflation_format, deflation_args = self._compute_deflation_scaler(signal)
 
         # Hard kill if scaler is 0.0 (tier 3)
         if deflation_scaler == 0.0:
@@ -499,7 +769,8 @@ class SovereignRatesShortEngine:
                 deflation_guard=True,  # Legacy compatibility
                 soft_kill=False,
                 regime=regime,
-                reason=f"DEFLATION KILL: {deflation_reason}"
+                reason_format="DEFLATION KILL: " + deflation_format,
+                reason_args=deflation_args,
             )
             self._last_sizing = result
             return result
@@ -518,25 +789,25 @@ class SovereignRatesShortEngine:
                 deflation_guard=False,
                 soft_kill=False,
                 regime=regime,
-                reason="HARD KILL: Loss threshold breached"
+                reason_format="HARD KILL: Loss threshold breached",
             )
             self._last_sizing = result
             return result
 
         # Compute fragmentation multiplier
-        if signal.spread_z < self.config.frag_mult_z_low:
+        if spread_z < cfg.frag_mult_z_low:
             frag_mult = 0.5
-        elif signal.spread_z < self.config.frag_mult_z_mid:
+        elif spread_z < cfg.frag_mult_z_mid:
             frag_mult = 1.0
-        elif signal.spread_z < self.config.frag_mult_z_high:
+        elif spread_z < cfg.frag_mult_z_high:
             frag_mult = 1.3
         else:
             frag_mult = 1.6
 
         # Compute rates-up multiplier
-        if signal.bund_yield_mom_60d < self.config.rates_mult_low_bps:
+        if bund_mom_60d < cfg.rates_mult_low_bps:
             rates_mult = 0.8
-        elif signal.bund_yield_mom_60d < self.config.rates_mult_high_bps:
+        elif bund_mom_60d < cfg.rates_mult_high_bps:
             rates_mult = 1.0
         else:
             rates_mult = 1.2
@@ -552,16 +823,14 @@ class SovereignRatesShortEngine:
         # Clamp to max
         target_w = max(0.0, min(target_w, max_w))
 
-        # Build reason string
-        reason_parts = []
-        reason_parts.append(f"regime={regime_key}")
-        reason_parts.append(f"base={base_w:.2%}")
-        reason_parts.append(f"frag_mult={frag_mult:.1f} (z={signal.spread_z:.2f})")
-        reason_parts.append(f"rates_mult={rates_mult:.1f} (bund_60d={signal.bund_yield_mom_60d:.0f}bps)")
+        # Reason is formatted only if someone reads it
+        reason_format = _SIZING_REASON_FORMAT
+        reason_args = (regime_key, base_w * 100, frag_mult, spread_z, rates_mult, bund_mom_60d)
         if deflation_scaler < 1.0:
-            reason_parts.append(f"defl_scaler={deflation_scaler:.2f} ({deflation_reason})")
+            reason_format += "; defl_scaler=%.2f (" + deflation_format + ")"
+            reason_args += (deflation_scaler,) + deflation_args
         if soft_kill:
-            reason_parts.append("SOFT_KILL (-50%)")
+            reason_format += "; SOFT_KILL (-50%%)"
 
         result = SizingResult(
             target_weight=target_w,
@@ -573,7 +842,8 @@ class SovereignRatesShortEngine:
             deflation_guard=(deflation_scaler == 0.0),  # Legacy
             soft_kill=soft_kill,
             regime=regime,
-            reason="; ".join(reason_parts)
+            reason_format=reason_format,
+            reason_args=reason_args,
         )
 
         self._last_sizing = result
@@ -586,47 +856,52 @@ class SovereignRatesShortEngine:
         current_daily_pnl: float
     ) -> KillSwitchType:
         """Check kill-switch conditions."""
+        cfg = self.config
+        tracker = self._tracker
+
         # Hard kill: daily loss exceeds threshold
         daily_loss_pct = -current_daily_pnl / nav if nav > 0 else 0
-        if daily_loss_pct > self.config.hard_kill_daily_loss_pct:
+        if daily_loss_pct > cfg.hard_kill_daily_loss_pct:
             logger.warning(
-                f"HARD KILL: Daily loss {daily_loss_pct:.2%} > "
-                f"{self.config.hard_kill_daily_loss_pct:.2%} threshold"
+                "HARD KILL: Daily loss %.2f%% > %.2f%% threshold",
+                daily_loss_pct * 100, cfg.hard_kill_daily_loss_pct * 100,
             )
-            self._tracker.state = SleeveState.HARD_KILLED
+            tracker.state = SleeveState.HARD_KILLED
             return KillSwitchType.HARD
 
         # Hard kill: 10-day drawdown exceeds threshold
-        rolling_10d_pnl_pct = self._tracker.rolling_10d_pnl / nav if nav > 0 else 0
-        if rolling_10d_pnl_pct < -self.config.hard_kill_10d_drawdown_pct:
+        rolling_10d_pnl_pct = tracker.rolling_10d_pnl / nav if nav > 0 else 0
+        if rolling_10d_pnl_pct < -cfg.hard_kill_10d_drawdown_pct:
             logger.warning(
-                f"HARD KILL: 10-day drawdown {rolling_10d_pnl_pct:.2%} > "
-                f"{self.config.hard_kill_10d_drawdown_pct:.2%} threshold"
+                "HARD KILL: 10-day drawdown %.2f%% > %.2f%% threshold",
+                rolling_10d_pnl_pct * 100, cfg.hard_kill_10d_drawdown_pct * 100,
             )
-            self._tracker.state = SleeveState.HARD_KILLED
+            tracker.state = SleeveState.HARD_KILLED
             return KillSwitchType.HARD
 
         # Soft kill: spread compressing strongly
-        if signal.spread_z < self.config.soft_kill_spread_z:
+        spread_z = signal.spread_z
+        if spread_z < cfg.soft_kill_spread_z:
             logger.info(
-                f"SOFT KILL: Spread z={signal.spread_z:.2f} < "
-                f"{self.config.soft_kill_spread_z} threshold"
+                "SOFT KILL: Spread z=%.2f < %s threshold",
+                spread_z, cfg.soft_kill_spread_z,
             )
-            self._tracker.state = SleeveState.SOFT_KILLED
+            tracker.state = SleeveState.SOFT_KILLED
             return KillSwitchType.SOFT
 
         # Soft kill: rates rallying (bonds up)
-        if signal.bund_yield_mom_20d < self.config.soft_kill_bund_mom_20d_bps:
+        bund_mom_20d = signal.bund_yield_mom_20d
+        if bund_mom_20d < cfg.soft_kill_bund_mom_20d_bps:
             logger.info(
-                f"SOFT KILL: Bund mom 20d={signal.bund_yield_mom_20d:.0f}bps < "
-                f"{self.config.soft_kill_bund_mom_20d_bps}bps threshold"
+                "SOFT KILL: Bund mom 20d=%.0fbps < %sbps threshold",
+                bund_mom_20d, cfg.soft_kill_bund_mom_20d_bps,
             )
-            self._tracker.state = SleeveState.SOFT_KILLED
+            tracker.state = SleeveState.SOFT_KILLED
             return KillSwitchType.SOFT
 
         # Clear soft kill if conditions no longer apply
-        if self._tracker.state == SleeveState.SOFT_KILLED:
-            self._tracker.state = SleeveState.ACTIVE
+        if tracker.state == SleeveState.SOFT_KILLED:
+            tracker.state = SleeveState.ACTIVE
 
         return KillSwitchType.NONE
 
@@ -696,12 +971,13 @@ class SovereignRatesShortEngine:
 
         self._last_position = position
 
-        logger.info(
-            f"DV01 position: BTP={btp_contracts} ({dv01_per_btp:.0f} DV01/ct), "
-            f"Bund={bund_contracts} ({dv01_per_bund:.0f} DV01/ct), "
-            f"target_dv01={target_dv01:.0f}, net_dv01={actual_net_dv01:.0f}, "
-            f"neutral={position.is_neutral}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "DV01 position: BTP=%d (%.0f DV01/ct), Bund=%d (%.0f DV01/ct), "
+                "target_dv01=%.0f, net_dv01=%.0f, neutral=%s",
+                btp_contracts, dv01_per_btp, bund_contracts, dv01_per_bund,
+                target_dv01, actual_net_dv01, position.is_neutral,
+            )
 
         return position
 
@@ -731,8 +1007,8 @@ class SovereignRatesShortEngine:
         # Check spread z-score threshold
         if signal.spread_z >= self.config.take_profit_spread_z:
             logger.info(
-                f"TAKE PROFIT: Spread z={signal.spread_z:.2f} >= "
-                f"{self.config.take_profit_spread_z} threshold"
+                "TAKE PROFIT: Spread z=%.2f >= %s threshold",
+                signal.spread_z, self.config.take_profit_spread_z,
             )
             return True, self.config.profit_take_pct, "Spread z-score threshold"
 
@@ -741,8 +1017,8 @@ class SovereignRatesShortEngine:
             widening = signal.spread_bps - self._tracker.entry_spread_avg_bps
             if widening >= self.config.take_profit_spread_widening_bps:
                 logger.info(
-                    f"TAKE PROFIT: Spread widened {widening:.0f}bps >= "
-                    f"{self.config.take_profit_spread_widening_bps}bps threshold"
+                    "TAKE PROFIT: Spread widened %.0fbps >= %sbps threshold",
+                    widening, self.config.take_profit_spread_widening_bps,
                 )
                 return True, self.config.profit_take_pct, "Spread widening threshold"
 
@@ -805,7 +1081,7 @@ class SovereignRatesShortEngine:
             adjusted_weight = sizing.target_weight * (1 - take_pct)
             position = self.compute_dv01_position(adjusted_weight, nav, use_etf_fallback)
             self._tracker.last_profit_take_date = today
-            logger.info(f"Taking profit ({take_pct:.0%}): {take_reason}")
+            logger.info("Taking profit (%.0f%%): %s", take_pct * 100, take_reason)
         else:
             position = self.compute_dv01_position(sizing.target_weight, nav, use_etf_fallback)
 
@@ -435,7 +435,7 @@ class Strategy:
         """
         self.sector_pair_engine: Optional[SectorPairEngine] = None
         self.use_sector_pairs = False
-        self._last_sector_pair_positions: List[SectorPairPosition] = []
+        self._last_sector_pair_positions: Tuple[SectorPairPosition, ...] = ()
 
         if not SECTOR_PAIRS_ENGINE_AVAILABLE:
             logger.warning("SectorPairEngine not available - using static ETF baskets")
@@ -454,7 +454,7 @@ class Strategy:
             included_sectors = []
             for name in included_sector_names:
                 try:
-                    sector = Sector(name.lower())
+                    sector = Sector.from_str(name)
                     included_sectors.append(sector)
                 except ValueError:
                     logger.warning(f"Unknown sector: {name}")
@@ -474,7 +474,7 @@ class Strategy:
             self.sector_pair_engine = SectorPairEngine(engine_config)
             logger.info(
                 f"SectorPairEngine initialized with {len(included_sectors)} sectors: "
-                f"{[s.value for s in included_sectors]}"
+                f"{[s.sector_str for s in included_sectors]}"
             )
         else:
             logger.info("Sector pairs disabled - using static ETF baskets")
@@ -495,7 +495,7 @@ class Strategy:
 
         for pos in self._last_sector_pair_positions:
             positions_summary.append({
-                "sector": pos.pair.sector.value,
+                "sector": pos.pair.sector.sector_str,
                 "us_symbol": pos.pair.us_symbol,
                 "eu_symbol": pos.pair.eu_symbol,
                 "us_notional": pos.us_notional,
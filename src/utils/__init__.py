@@ -3,6 +3,7 @@
 from .invariants import (
     InvariantError,
     assert_position_id_valid,
+    check_position_ids,
     assert_no_conflicting_orders,
     assert_gbx_whitelist_valid,
     validate_instruments_config,
@@ -13,6 +14,7 @@ from .invariants import (
 __all__ = [
     "InvariantError",
     "assert_position_id_valid",
+    "check_position_ids",
     "assert_no_conflicting_orders",
     "assert_gbx_whitelist_valid",
     "validate_instruments_config",
@@ -8,6 +8,7 @@ allowing silent corruption to propagate through the system.
 Usage:
     from src.utils.invariants import (
         assert_position_id_valid,
+        check_position_ids,
         assert_no_conflicting_orders,
         assert_gbx_whitelist_valid,
         validate_instruments_config,
@@ -15,7 +16,7 @@ Usage:
 """
 
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Collection, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -45,9 +46,6 @@ def assert_position_id_valid(
     Raises:
         InvariantError: If ID is invalid or is an IBKR symbol instead of config ID
     """
-    # Handle futures with expiry suffix
-    base_id = instrument_id.split("_")[0] if "_" in instrument_id else instrument_id
-
     # Build lookup of config IDs and symbols
     config_ids: Set[str] = set()
     symbol_to_config_id: Dict[str, str] = {}
@@ -61,18 +59,62 @@ def assert_position_id_valid(
                 symbol = spec.get("symbol", inst_id)
                 symbol_to_config_id[symbol] = inst_id
 
+    error = _position_id_error(instrument_id, config_ids, symbol_to_config_id, context)
+    if error:
+        raise InvariantError(error)
+
+
+def check_position_ids(
+    instrument_ids: Iterable[str],
+    config_to_symbol: Mapping[str, str],
+    symbol_to_config: Mapping[str, str],
+    context: str = "",
+) -> List[str]:
+    """
+    Batch form of assert_position_id_valid using prebuilt ID mappings.
+
+    Avoids rebuilding the config lookups for every position.
+
+    Args:
+        instrument_ids: The IDs to validate
+        config_to_symbol: Config ID -> symbol mapping from build_id_mappings()
+        symbol_to_config: Symbol -> config ID mapping from build_id_mappings()
+        context: Additional context for error messages
+
+    Returns:
+        List of error messages, one per ID that is an IBKR symbol instead of
+        a config ID (empty if all valid)
+    """
+    errors = []
+    for instrument_id in instrument_ids:
+        error = _position_id_error(
+            instrument_id, config_to_symbol.keys(), symbol_to_config, context
+        )
+        if error:
+            errors.append(error)
+    return errors
+
+
+def _position_id_error(
+    instrument_id: str,
+    config_ids: Collection[str],
+    symbol_to_config_id: Mapping[str, str],
+    context: str,
+) -> Optional[str]:
+    """Core of assert_position_id_valid; returns the error message, if any."""
     # Check if it's a valid config ID
     if instrument_id in config_ids:
-        return  # Valid
+        return None  # Valid
 
     # Check if base_id (without expiry) is a config ID (for futures)
+    base_id = instrument_id.split("_")[0] if "_" in instrument_id else instrument_id
     if base_id in config_ids:
-        return  # Valid future with expiry suffix
+        return None  # Valid future with expiry suffix
 
     # Check if it's an IBKR symbol instead of config ID
     if instrument_id in symbol_to_config_id:
         correct_id = symbol_to_config_id[instrument_id]
-        raise InvariantError(
+        return (
             f"Position uses IBKR symbol '{instrument_id}' instead of config ID '{correct_id}'. "
             f"Check _contract_to_instrument_id() reverse mapping. {context}"
         )
@@ -81,6 +123,7 @@ def assert_position_id_valid(
     logger.warning(
         f"Unknown instrument_id '{instrument_id}' not in config. {context}"
     )
+    return None
 
 
 def assert_no_conflicting_orders(
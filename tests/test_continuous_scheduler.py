@@ -0,0 +1,202 @@
+"""
+Tests for the continuous scheduler and IBKR maintenance windows.
+
+Tests cover:
+- Run-once-per-day eligibility and re-eligibility the next day
+- Choosing between several configured run times
+- Deferring due runs through a maintenance window
+- Maintenance window lookups across the weekly wrap
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import src.scheduler.continuous as continuous
+from src.scheduler.continuous import ContinuousScheduler
+from src.scheduler.maintenance import (
+    is_maintenance_window,
+    get_next_maintenance_window,
+    _is_maintenance_window_cached,
+)
+
+UTC = timezone.utc
+
+RUN_TIMES = [
+    {'name': 'EU_open', 'hour_utc': 9, 'minute_utc': 15, 'exchanges': ['LSE']},
+    {'name': 'US_open', 'hour_utc': 15, 'minute_utc': 0, 'exchanges': ['NYSE']},
+]
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def _make_scheduler(started_at: datetime, run_times=None) -> ContinuousScheduler:
+    """Build a scheduler as if it had been started at `started_at`."""
+    settings = {'schedule': {'timezone': 'UTC', 'run_times': run_times or RUN_TIMES}}
+
+    class _StartClock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return started_at
+
+    with patch.object(continuous, 'load_settings', return_value=settings), \
+            patch.object(continuous, 'datetime', _StartClock), \
+            patch.object(continuous.signal, 'signal'):
+        return ContinuousScheduler()
+
+
+class TestNextAction:
+    """Tests for ContinuousScheduler._next_action and _mark_completed."""
+
+    def test_runs_once_per_day(self):
+        """A completed run waits for its slot tomorrow, then is due again."""
+        # Monday 2024-01-08
+        scheduler = _make_scheduler(_utc(2024, 1, 8, 8, 0))
+
+        run_index, sleep_seconds = scheduler._next_action(_utc(2024, 1, 8, 8, 0))
+        assert run_index is None
+        assert sleep_seconds == 75 * 60
+
+        now = _utc(2024, 1, 8, 9, 20, 30)
+        run_index, _ = scheduler._next_action(now)
+        assert run_index == 0
+
+        scheduler._mark_completed(run_index, now)
+        run_index, sleep_seconds = scheduler._next_action(now)
+        assert run_index is None
+        # Sleeps until US_open, not back to EU_open
+        assert sleep_seconds == (15 * 60 - (9 * 60 + 20)) * 60 - 30
+
+        # Later the same day only US_open is owed
+        assert scheduler._next_action(_utc(2024, 1, 8, 23, 59))[0] == 1
+        scheduler._mark_completed(1, _utc(2024, 1, 8, 23, 59))
+
+        # Not yet eligible just before tomorrow's slot, eligible at it
+        run_index, sleep_seconds = scheduler._next_action(_utc(2024, 1, 9, 9, 10))
+        assert run_index is None
+        assert sleep_seconds == 5 * 60
+        assert scheduler._next_action(_utc(2024, 1, 9, 9, 15))[0] == 0
+
+    def test_reeligible_next_day(self):
+        """Both runs become due again the day after they completed."""
+        scheduler = _make_scheduler(_utc(2024, 1, 8, 8, 0))
+        scheduler._mark_completed(0, _utc(2024, 1, 8, 9, 15))
+        scheduler._mark_completed(1, _utc(2024, 1, 8, 15, 0))
+
+        run_index, sleep_seconds = scheduler._next_action(_utc(2024, 1, 9, 9, 0))
+        assert run_index is None
+        assert sleep_seconds == 15 * 60
+
+        assert scheduler._next_action(_utc(2024, 1, 9, 9, 15))[0] == 0
+
+    def test_several_due_runs_in_config_order(self):
+        """With several runs due, the first configured one goes first."""
+        # Started after both of today's slots: both are still owed today
+        scheduler = _make_scheduler(_utc(2024, 1, 8, 16, 0))
+        now = _utc(2024, 1, 8, 16, 0)
+
+        assert scheduler._next_action(now)[0] == 0
+        scheduler._mark_completed(0, now)
+        assert scheduler._next_action(now)[0] == 1
+        scheduler._mark_completed(1, now)
+
+        run_index, sleep_seconds = scheduler._next_action(now)
+        assert run_index is None
+        # Next is EU_open tomorrow at 09:15
+        assert sleep_seconds == (24 * 60 - (16 * 60) + 9 * 60 + 15) * 60
+
+    def test_minimum_sleep(self):
+        """The loop never sleeps less than a minute."""
+        scheduler = _make_scheduler(_utc(2024, 1, 8, 8, 0))
+        scheduler._mark_completed(0, _utc(2024, 1, 8, 9, 15))
+        _, sleep_seconds = scheduler._next_action(_utc(2024, 1, 8, 14, 59, 45))
+        assert sleep_seconds == 60
+
+
+class TestMaintenanceSkip:
+    """Tests for holding due runs through IBKR maintenance."""
+
+    def test_due_run_deferred_until_window_end(self):
+        """A run due inside the daily window is held until the window ends."""
+        # Friday 2024-01-12, 22:05:20 UTC: daily_disconnect ends at 22:15
+        now = _utc(2024, 1, 12, 22, 5, 20)
+        late_run = [{'name': 'late', 'hour_utc': 22, 'minute_utc': 0}]
+        scheduler = _make_scheduler(now, late_run)
+
+        class _LoopClock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return now
+
+        sleeps = []
+
+        def _sleep(seconds):
+            sleeps.append(seconds)
+            return True  # Stop after the first wait
+
+        with patch.object(continuous, 'datetime', _LoopClock), \
+                patch.object(continuous, 'start_health_server', Mock()), \
+                patch('src.metrics.start_metrics_server', Mock()), \
+                patch.object(scheduler, '_wait_for_ib_gateway', return_value=True), \
+                patch.object(scheduler, '_run_daily_with_retries') as run_daily, \
+                patch.object(scheduler, '_sleep', side_effect=_sleep):
+            scheduler.run()
+
+        run_daily.assert_not_called()
+        assert sleeps == [10 * 60 - 20]
+        # Still owed once the window is over
+        assert scheduler._next_action(_utc(2024, 1, 12, 22, 15))[0] == 0
+
+
+class TestMaintenanceWindows:
+    """Tests for maintenance window lookups."""
+
+    @pytest.mark.parametrize("now, expected", [
+        (_utc(2024, 1, 14, 23, 44), (False, None, 0)),          # Sunday, before
+        (_utc(2024, 1, 14, 23, 45), (True, "weekly_restart", 60)),
+        (_utc(2024, 1, 14, 23, 59), (True, "weekly_restart", 46)),  # Remaining spans midnight
+        (_utc(2024, 1, 15, 0, 45), (False, None, 0)),           # Monday, after the window
+        (_utc(2024, 1, 12, 22, 0), (True, "daily_disconnect", 15)),  # Friday
+        (_utc(2024, 1, 13, 22, 0), (False, None, 0)),           # Saturday
+    ])
+    def test_is_maintenance_window(self, now, expected):
+        """Window membership and minutes remaining, including past midnight."""
+        assert is_maintenance_window(now) == expected
+
+    def test_lookup_memoized_per_minute(self):
+        """Lookups within the same minute share one cached result."""
+        _is_maintenance_window_cached.cache_clear()
+        first = is_maintenance_window(_utc(2024, 1, 12, 22, 5, 1))
+        second = is_maintenance_window(_utc(2024, 1, 12, 22, 5, 59))
+
+        assert first == second == (True, "daily_disconnect", 10)
+        assert _is_maintenance_window_cached.cache_info().hits == 1
+
+    def test_next_window_wraps_the_week(self):
+        """The weekly restart is found from Sunday evening; Friday sees nothing within 24h."""
+        # Sunday 22:00: weekly restart starts in 105 minutes
+        assert get_next_maintenance_window(_utc(2024, 1, 14, 22, 0)) == {
+            "name": "weekly_restart",
+            "starts_in_minutes": 105,
+            "duration_minutes": 60,
+        }
+        # Friday 22:15: nothing until Sunday night, beyond 24h
+        assert get_next_maintenance_window(_utc(2024, 1, 12, 22, 15)) is None
+
+    def test_next_window_after_weekly_restart(self):
+        """Early Monday, the next window is Monday's daily disconnect."""
+        assert get_next_maintenance_window(_utc(2024, 1, 15, 0, 30)) == {
+            "name": "daily_disconnect",
+            "starts_in_minutes": 21 * 60 + 30,
+            "duration_minutes": 15,
+        }
+
+    def test_next_window_wraps_from_sunday_after_restart_start(self):
+        """After the week's last window starts, lookup wraps to Monday."""
+        assert get_next_maintenance_window(_utc(2024, 1, 14, 23, 50)) == {
+            "name": "daily_disconnect",
+            "starts_in_minutes": 10 + 22 * 60,
+            "duration_minutes": 15,
+        }
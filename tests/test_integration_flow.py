@@ -15,6 +15,7 @@ from typing import Dict, Any, List
 # Import the modules we're testing
 from src.utils.invariants import (
     assert_position_id_valid,
+    check_position_ids,
     assert_no_conflicting_orders,
     assert_gbx_whitelist_valid,
     validate_instruments_config,
@@ -68,6 +69,20 @@ class TestPositionIDMapping:
         )
         assert "Unknown instrument_id 'UNKNOWN_INST'" in caplog.text
 
+    def test_check_position_ids_batch(self, sample_instruments_config):
+        """Batch check reports only IBKR symbols, using prebuilt mappings."""
+        config_to_symbol, symbol_to_config = build_id_mappings(sample_instruments_config)
+
+        errors = check_position_ids(
+            ["us_index_etf", "CSPX", "eurusd_micro_20260316", "UNKNOWN_INST"],
+            config_to_symbol,
+            symbol_to_config,
+            context="test"
+        )
+        assert len(errors) == 1
+        assert "IBKR symbol 'CSPX'" in errors[0]
+        assert "config ID 'us_index_etf'" in errors[0]
+
     def test_build_id_mappings(self, sample_instruments_config):
         """Test bidirectional ID mapping construction."""
         config_to_symbol, symbol_to_config = build_id_mappings(sample_instruments_config)
@@ -0,0 +1,143 @@
+"""
+Unit tests for factor-neutral sector pairs.
+
+Tests cover:
+- Position sizing (beta adjustment, factor neutralization)
+- Expected return (scalar and batch)
+- Tradeable instruments
+"""
+
+import pytest
+import numpy as np
+
+from src.sector_pairs import (
+    SectorPairEngine,
+    Sector,
+    SECTOR_PAIRS,
+    compute_sector_pairs_return,
+)
+
+
+class TestComputePositions:
+    """Tests for SectorPairEngine.compute_positions."""
+
+    def test_default_sectors(self):
+        """Default config trades the UCITS-available pairs."""
+        engine = SectorPairEngine()
+        positions = engine.compute_positions(sleeve_nav=1_000_000)
+
+        assert isinstance(positions, tuple)
+        assert [p.pair.sector for p in positions] == [Sector.TECHNOLOGY, Sector.HEALTHCARE]
+        for pos in positions:
+            assert pos.us_notional > 0
+            assert pos.eu_notional < 0
+
+    def test_beta_adjust(self):
+        """EU leg is scaled by the pair's beta ratio."""
+        engine = SectorPairEngine({
+            "included_sectors": [Sector.ENERGY],
+            "neutralize_growth_value": False,
+        })
+        pos = engine.compute_positions(sleeve_nav=1_000_000)[0]
+
+        assert pos.us_notional == pytest.approx(500_000)
+        assert pos.eu_notional == pytest.approx(-500_000 * SECTOR_PAIRS[Sector.ENERGY].beta_ratio)
+        assert pos.net_regional_exposure == pytest.approx(pos.us_notional - pos.eu_notional)
+
+    def test_unavailable_sector_skipped(self):
+        """Sectors without a defined pair are ignored."""
+        engine = SectorPairEngine({"included_sectors": [Sector.FINANCIALS]})
+        assert len(engine.compute_positions(sleeve_nav=1_000_000)) == 0
+
+    def test_neutralization_scales_contributors_down(self):
+        """Pairs adding to net growth exposure are scaled down by 10%."""
+        engine = SectorPairEngine({
+            "included_sectors": [Sector.TECHNOLOGY, Sector.ENERGY],
+            "beta_adjust": False,
+            "max_growth_exposure": 0.0,
+        })
+        tech, energy = engine.compute_positions(sleeve_nav=1_000_000)
+
+        # Tech is net long growth; energy has no net growth tilt
+        assert tech.growth_adjustment == pytest.approx(-0.1)
+        assert tech.us_notional == pytest.approx(250_000 * 0.9)
+        assert energy.growth_adjustment == 0.0
+        assert energy.us_notional == pytest.approx(250_000)
+
+
+class TestExpectedReturn:
+    """Tests for expected return calculations."""
+
+    def test_batch_matches_scalar(self):
+        """Batch returns equal per-bar compute_expected_return."""
+        engine = SectorPairEngine()
+        positions = engine.compute_positions(sleeve_nav=1_000_000, scaling=0.8)
+
+        rng = np.random.default_rng(0)
+        us = rng.normal(0, 0.01, 50)
+        eu = rng.normal(0, 0.01, 50)
+
+        batch = engine.compute_expected_return_batch(positions, us, eu)
+        scalar = [engine.compute_expected_return(positions, u, e) for u, e in zip(us, eu)]
+
+        np.testing.assert_allclose(batch, scalar, rtol=1e-12, atol=1e-15)
+
+    def test_flat_matches_scalar(self):
+        """Flattened positions give the same return as the position objects."""
+        engine = SectorPairEngine()
+        positions = engine.compute_positions(sleeve_nav=1_000_000, scaling=0.8)
+        flat = engine.flatten_positions(positions)
+
+        assert flat.sectors == (Sector.TECHNOLOGY, Sector.HEALTHCARE)
+        # Sector returns equal to the beta-scaled market moves force the
+        # per-position path without changing the result
+        healthcare = SECTOR_PAIRS[Sector.HEALTHCARE]
+        sector_returns = {
+            Sector.HEALTHCARE: (0.01 * healthcare.us_beta, -0.004 * healthcare.eu_beta),
+        }
+        assert engine.compute_expected_return_flat(flat, 0.01, -0.004) == pytest.approx(
+            engine.compute_expected_return(positions, 0.01, -0.004, sector_returns)
+        )
+
+    def test_no_positions(self):
+        """Empty positions produce zero return."""
+        engine = SectorPairEngine()
+        assert engine.compute_expected_return([], 0.01, -0.01) == 0.0
+        assert np.all(engine.compute_expected_return_batch([], np.ones(3), np.ones(3)) == 0.0)
+
+    def test_convenience_function(self):
+        """compute_sector_pairs_return uses the default engine."""
+        engine = SectorPairEngine()
+        positions = engine.compute_positions(1.0, 0.5)
+
+        expected = engine.compute_expected_return(positions, 0.01, 0.005)
+        assert compute_sector_pairs_return(0.01, 0.005, 1.0, 0.5) == pytest.approx(expected)
+
+
+class TestTradeableInstruments:
+    """Tests for get_tradeable_instruments."""
+
+    def test_two_legs_per_pair(self):
+        """Each included pair contributes a US and an EU instrument."""
+        engine = SectorPairEngine()
+        instruments = engine.get_tradeable_instruments()
+
+        assert [i["symbol"] for i in instruments] == ["IUIT", "EXV3", "IUHC", "EXV4"]
+        assert instruments[0]["sector"] == "technology"
+        assert instruments[1]["region"] == "EU"
+
+
+class TestSector:
+    """Tests for the Sector enum string helpers."""
+
+    def test_string_round_trip(self):
+        """sector_str and from_str map to and from the GICS-style names."""
+        assert Sector.CONSUMER_DISCRETIONARY.sector_str == "consumer_discretionary"
+        assert Sector.from_str("Technology") is Sector.TECHNOLOGY
+        for sector in Sector:
+            assert Sector.from_str(sector.sector_str) is sector
+
+    def test_unknown_name(self):
+        """Unknown names raise ValueError like Enum value lookup."""
+        with pytest.raises(ValueError):
+            Sector.from_str("crypto")
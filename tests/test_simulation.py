@@ -0,0 +1,117 @@
+"""
+Unit tests for the simulation runner.
+
+Tests cover:
+- Gross exposure with FX conversion
+- Glidepath blending and order generation
+- Post-trade gross exposure
+- Predeploy scenario batches
+"""
+
+import pytest
+
+from src.simulation import (
+    SimulationRunner,
+    SimulationScenario,
+)
+
+
+INSTRUMENTS_CONFIG = {
+    "core_index_rv": {
+        "us_index_etf": {"symbol": "CSPX", "currency": "USD"},
+        "eu_index_etf": {"symbol": "CS51", "currency": "EUR"},
+    },
+    "credit_carry": {
+        "uk_gilt_etf": {"symbol": "IGLT", "currency": "GBP"},
+    },
+}
+
+FX_RATES = {"EURUSD": 1.10, "GBPUSD": 1.25}
+
+
+@pytest.fixture
+def runner():
+    return SimulationRunner(INSTRUMENTS_CONFIG)
+
+
+class TestGrossExposure:
+    """Tests for gross exposure calculation."""
+
+    def test_fx_conversion(self, runner):
+        """EUR and GBP notionals are converted to USD; shorts count gross."""
+        gross = runner._calc_gross_exposure(
+            {"us_index_etf": 10, "eu_index_etf": -5, "uk_gilt_etf": 2},
+            {"us_index_etf": 100.0, "eu_index_etf": 40.0, "uk_gilt_etf": 10.0},
+            FX_RATES,
+        )
+        assert gross == pytest.approx(1000.0 + 200.0 * 1.10 + 20.0 * 1.25)
+
+    def test_missing_price_is_zero(self, runner):
+        """Positions without a price contribute nothing."""
+        assert runner._calc_gross_exposure({"us_index_etf": 10}, {}, FX_RATES) == 0.0
+
+
+class TestRunScenario:
+    """Tests for SimulationRunner.run_scenario."""
+
+    def _scenario(self, glidepath_day):
+        return SimulationScenario(
+            name=f"day {glidepath_day}",
+            mock_positions={"us_index_etf": 100.0, "eu_index_etf": -50.0},
+            mock_prices={"us_index_etf": 500.0, "eu_index_etf": 50.0},
+            glidepath_day=glidepath_day,
+            nav=100_000.0,
+            fx_rates=FX_RATES,
+        )
+
+    def test_skip_path_generates_no_orders(self, runner):
+        """glidepath_day < 0 leaves positions unchanged."""
+        result = runner.run_scenario(self._scenario(-1))
+
+        assert result.success
+        assert result.orders == []
+        assert result.position_changes == {}
+        assert result.gross_exposure_after == result.gross_exposure_before
+
+    def test_glidepath_blend(self, runner):
+        """Mid-glidepath positions move halfway toward the targets."""
+        result = runner.run_scenario(self._scenario(5))
+
+        # Gross = 50,000 + 2,500 * 1.10 = 52,750; target scale = 160,000 / 52,750
+        scale = min(100_000.0 * 1.6 / 52_750.0, 2.0)
+        before, after = result.position_changes["us_index_etf"]
+        assert before == 100.0
+        assert after == pytest.approx(100.0 * (0.5 * scale + 0.5))
+
+        sides = {o.instrument_id: o.side for o in result.orders}
+        assert sides == {"us_index_etf": "BUY", "eu_index_etf": "SELL"}
+
+    def test_gross_after_covers_full_portfolio(self, runner):
+        """Post-trade gross includes unchanged positions, not just the changes."""
+        scenario = self._scenario(10)
+        result = runner.run_scenario(scenario)
+        assert result.position_changes
+
+        after = dict(scenario.mock_positions)
+        after.update({k: b for k, (_, b) in result.position_changes.items()})
+        expected = runner._calc_gross_exposure(after, scenario.mock_prices, FX_RATES)
+        assert result.gross_exposure_after == pytest.approx(expected)
+
+        # Day 0 changes nothing, so exposure is unchanged (not zero)
+        result = runner.run_scenario(self._scenario(0))
+        assert result.position_changes == {}
+        assert result.gross_exposure_after == pytest.approx(52_750.0)
+
+
+class TestPredeployChecks:
+    """Tests for batched predeploy scenarios."""
+
+    def test_predeploy_checks_pass(self, runner):
+        """All standard predeploy scenarios pass for config IDs."""
+        report = runner.run_predeploy_checks(
+            {"us_index_etf": 100.0, "eu_index_etf": -50.0},
+            {"us_index_etf": 500.0, "eu_index_etf": 50.0},
+        )
+
+        assert report.total_scenarios == 5
+        assert report.all_passed
@@ -0,0 +1,250 @@
+"""
+Unit tests for the sovereign crisis overlay.
+
+Tests cover:
+- Stress signal computation from proxy price history
+- Price history cache persistence
+- Position expiry, position index and budget derived values
+- Overlay coverage order generation
+"""
+
+import pytest
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+from unittest.mock import Mock
+
+from src.sovereign_overlay import (
+    SovereignCrisisOverlay,
+    SovereignCountry,
+    OverlayBudget,
+    OverlayConfig,
+    OverlayPosition,
+    SOVEREIGN_PROXIES,
+    StressLevel,
+    OverlayAction,
+)
+
+
+@pytest.fixture
+def overlay():
+    return SovereignCrisisOverlay()
+
+
+class TestStressSignal:
+    """Tests for SovereignCrisisOverlay.compute_stress_signal."""
+
+    def test_insufficient_history(self, overlay):
+        """Fewer than 20 closes yields a LOW/HOLD default signal."""
+        overlay.update_price_history("EWI", pd.Series(np.full(19, 30.0)))
+        signal = overlay.compute_stress_signal(SovereignCountry.ITALY, 10.0)
+
+        assert signal.stress_level == StressLevel.LOW
+        assert signal.action == OverlayAction.HOLD
+        assert signal.commentary == "Insufficient price history"
+
+    def test_drawdown_uses_trailing_year_high(self, overlay):
+        """The 52-week high ignores closes older than 252 bars."""
+        prices = np.full(300, 30.0)
+        prices[:48] = 100.0  # Outside the trailing 252-bar window
+        overlay.update_price_history("EWI", pd.Series(prices))
+
+        signal = overlay.compute_stress_signal(SovereignCountry.ITALY, 15.0)
+
+        assert signal.spread_proxy == pytest.approx(0.5)
+        assert signal.stress_score == pytest.approx(1.0)
+        assert signal.stress_level == StressLevel.HIGH
+        assert signal.trend == "widening"
+        assert signal.action == OverlayAction.ADD
+
+    def test_thresholds_follow_config_changes(self, overlay):
+        """Threshold edits after construction apply to a repeated price."""
+        overlay.update_price_history("EWI", pd.Series(np.full(60, 40.0)))
+
+        # 30% drawdown
+        signal = overlay.compute_stress_signal(SovereignCountry.ITALY, 28.0)
+        assert signal.stress_level == StressLevel.ELEVATED
+
+        overlay.config.stress_threshold_high = 0.30
+        signal = overlay.compute_stress_signal(SovereignCountry.ITALY, 28.0)
+        assert signal.stress_level == StressLevel.HIGH
+
+    def test_summary_tracks_latest_signal(self, overlay):
+        """The cached summary section refreshes after a new signal."""
+        overlay.update_price_history("EWI", pd.Series(np.full(60, 40.0)))
+
+        overlay.compute_stress_signal(SovereignCountry.ITALY, 40.0)
+        assert overlay.get_summary()["stress_signals"][SovereignCountry.ITALY]["level"] == "low"
+
+        overlay.compute_stress_signal(SovereignCountry.ITALY, 20.0)
+        summary = overlay.get_summary()["stress_signals"][SovereignCountry.ITALY]
+        assert summary["level"] == "high"
+        assert summary["score"] == 1.0
+
+
+class TestPriceCache:
+    """Tests for price history persistence."""
+
+    def test_round_trip(self, tmp_path):
+        """Saved histories reload with identical stress signals."""
+        cache_file = tmp_path / "overlay" / "prices.npz"
+        overlay = SovereignCrisisOverlay(OverlayConfig(price_cache_path=str(cache_file)))
+        rng = np.random.default_rng(3)
+        overlay.update_price_history("EWI", pd.Series(30 + rng.normal(0, 1, 300)))
+        overlay.update_price_history("FXE", pd.Series(100 + rng.normal(0, 1, 40)))
+        overlay.save_price_cache()
+
+        restored = SovereignCrisisOverlay(OverlayConfig(price_cache_path=str(cache_file)))
+        assert restored.load_price_cache() == 2
+        np.testing.assert_array_equal(
+            restored._price_history["EWI"], overlay._price_history["EWI"]
+        )
+        before = overlay.compute_stress_signal(SovereignCountry.ITALY, 25.0)
+        after = restored.compute_stress_signal(SovereignCountry.ITALY, 25.0)
+        assert after.spread_proxy == before.spread_proxy
+        assert after.trend == before.trend
+
+    def test_missing_file(self, tmp_path):
+        """A missing cache file loads nothing."""
+        overlay = SovereignCrisisOverlay()
+        assert overlay.load_price_cache(str(tmp_path / "absent.npz")) == 0
+        with pytest.raises(ValueError):
+            overlay.save_price_cache()
+
+
+class TestOverlayPosition:
+    """Tests for OverlayPosition helpers."""
+
+    def test_days_to_expiry_reference_date(self):
+        """Expiry is measured from the supplied reference date."""
+        pos = OverlayPosition(
+            position_id="ewi_1",
+            proxy=SOVEREIGN_PROXIES[SovereignCountry.ITALY],
+            structure="put_spread",
+            quantity=5,
+            long_strike=27.0,
+            short_strike=25.5,
+            expiry=date(2025, 3, 21),
+            premium_paid=500.0,
+        )
+
+        assert pos.days_to_expiry(date(2025, 3, 1)) == 20
+        assert pos.days_to_expiry(date(2025, 3, 21)) == 0
+        assert pos.days_to_expiry() == (pos.expiry - date.today()).days
+
+
+class TestOverlayBudget:
+    """Tests for OverlayBudget derived values."""
+
+    def test_remaining_tracks_mutation(self):
+        """Cached values refresh when an input field is assigned."""
+        budget = OverlayBudget(annual_budget_pct=0.004, nav_at_year_start=1_000_000)
+        assert budget.total_budget == pytest.approx(4_000)
+        assert budget.remaining == pytest.approx(4_000)
+
+        budget.used_ytd += 1_000
+        budget.realized_gains_ytd += 400
+        assert budget.remaining == pytest.approx(3_200)
+
+        budget.nav_at_year_start = 2_000_000
+        assert budget.monthly_budget == pytest.approx(8_000 / 12)
+        assert budget.remaining == pytest.approx(7_200)
+
+        budget.used_ytd = 10_000
+        assert budget.remaining == 0
+
+
+class TestPositionIndex:
+    """Tests for the per-symbol position index."""
+
+    def _position(self, position_id, key, current_value):
+        return OverlayPosition(
+            position_id=position_id,
+            proxy=SOVEREIGN_PROXIES[key],
+            structure="put_spread",
+            quantity=2,
+            long_strike=27.0,
+            short_strike=25.5,
+            expiry=date.today() + timedelta(days=60),
+            premium_paid=500.0,
+            current_value=current_value,
+        )
+
+    def test_monetize_updates_index(self, overlay):
+        """Monetized positions leave both the book and the symbol index."""
+        overlay._add_position(self._position("ewi_win", SovereignCountry.ITALY, 900.0))
+        overlay._add_position(self._position("ewi_loss", SovereignCountry.ITALY, 100.0))
+        overlay._add_position(self._position("ewq_win", SovereignCountry.FRANCE, 900.0))
+        overlay.update_price_history("EWI", pd.Series(np.full(60, 40.0)))
+
+        # 60% drawdown with coverage in place -> MONETIZE
+        signal = overlay.compute_stress_signal(SovereignCountry.ITALY, 16.0)
+        assert signal.action == OverlayAction.MONETIZE
+
+        orders = overlay._create_monetization_orders(SOVEREIGN_PROXIES[SovereignCountry.ITALY])
+
+        assert [o.side for o in orders] == ["SELL", "BUY"]
+        assert set(overlay._positions) == {"ewi_loss", "ewq_win"}
+        assert [p.position_id for p in overlay._positions_by_symbol["EWI"]] == ["ewi_loss"]
+        assert [p.position_id for p in overlay._positions_by_symbol["EWQ"]] == ["ewq_win"]
+        assert overlay.get_total_premium_at_risk() == pytest.approx(1_000.0)
+
+    def test_book_totals(self, overlay):
+        """Delta and premium totals follow adds, revaluations, replacements and removals."""
+        pos = self._position("ewi_1", SovereignCountry.ITALY, 0.0)
+        pos.delta = -0.3
+        overlay._add_position(pos)
+        assert overlay.get_total_delta() == pytest.approx(-0.6)
+        assert overlay.get_total_premium_at_risk() == pytest.approx(500.0)
+
+        # Re-adding under the same id replaces the old contribution
+        replacement = self._position("ewi_1", SovereignCountry.ITALY, 0.0)
+        replacement.delta = -0.5
+        replacement.quantity = 4
+        overlay._add_position(replacement)
+        assert overlay.get_total_delta() == pytest.approx(-2.0)
+        assert overlay.get_total_premium_at_risk() == pytest.approx(500.0)
+
+        # Greeks are revalued in place
+        replacement.delta = -0.25
+        assert overlay.get_total_delta() == pytest.approx(-1.0)
+
+        overlay._remove_position("ewi_1")
+        assert overlay.get_total_delta() == 0.0
+        assert overlay.get_total_premium_at_risk() == 0.0
+
+
+class TestEnsureOverlayCoverage:
+    """Tests for SovereignCrisisOverlay.ensure_overlay_coverage."""
+
+    def test_batch_prices_fetched_once(self, overlay):
+        """Feeds with get_prices_batch are queried once for all proxies."""
+        feed = Mock(spec=["get_prices_batch", "get_last_price"])
+        feed.get_prices_batch.return_value = {"EWI": 30.0, "EWQ": 35.0}
+        overlay.update_price_history("EWI", pd.Series(np.full(60, 30.0)))
+        overlay.update_price_history("EWQ", pd.Series(np.full(60, 35.0)))
+
+        orders = overlay.ensure_overlay_coverage(Mock(nav=10_000_000), feed)
+
+        feed.get_prices_batch.assert_called_once()
+        feed.get_last_price.assert_not_called()
+        # Unpriced proxies are skipped; priced ones get a put spread
+        assert {o.instrument_id.split("_")[0] for o in orders} == {"EWI", "EWQ"}
+        assert set(overlay._stress_signals) == {
+            SovereignCountry.ITALY, SovereignCountry.FRANCE,
+        }
+
+    @pytest.mark.parametrize("feed", [Mock(), Mock(spec=["get_last_price"])])
+    def test_last_price_only_feed(self, overlay, feed):
+        """Feeds without a dict-returning batch call are priced per symbol."""
+        feed.get_last_price.side_effect = {"EWI": 30.0, "EWQ": 35.0}.get
+        overlay.update_price_history("EWI", pd.Series(np.full(60, 30.0)))
+        overlay.update_price_history("EWQ", pd.Series(np.full(60, 35.0)))
+
+        orders = overlay.ensure_overlay_coverage(Mock(nav=10_000_000), feed)
+
+        assert feed.get_last_price.call_count >= len(SOVEREIGN_PROXIES)
+        assert {o.instrument_id.split("_")[0] for o in orders} == {"EWI", "EWQ"}
+        assert set(overlay._stress_signals) == {
+            SovereignCountry.ITALY, SovereignCountry.FRANCE,
+        }
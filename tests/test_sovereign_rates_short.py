@@ -24,6 +24,7 @@ from src.sovereign_rates_short import (
     DV01Position,
     KillSwitchType,
     SleeveState,
+    SIGNAL_BATCH_DTYPE,
     create_sovereign_rates_short_engine,
 )
 from src.risk_engine import RiskRegime
@@ -48,6 +49,9 @@ class TestFragmentationSignal:
         assert signal.spread_bps == 200.0
         assert signal.vix_level == 20.0
         assert signal.stress_score == 0.3
+        # No wall-clock read unless a caller asks for one
+        assert signal.timestamp is None
+        assert isinstance(signal.timestamp_or_now, datetime)
 
     def test_spread_z_score_with_history(self):
         """Test spread z-score calculation with price history."""
@@ -72,6 +76,88 @@ class TestFragmentationSignal:
         # Spread is wider than historical average, so z should be positive
         assert signal.spread_z > 0
 
+    def test_yield_history_overwrite_and_eviction(self):
+        """Re-sent dates overwrite in place; the oldest dates roll off."""
+        engine = SovereignRatesShortEngine()
+        start = date(2024, 1, 1)
+
+        for i in range(310):
+            engine.update_yield_history(4.0, 2.0 + i / 100, start + timedelta(days=i))
+        # Correct a date in the middle of the window
+        engine.update_yield_history(4.0, 0.0, start + timedelta(days=306))
+
+        assert engine._history_len == 300
+        assert start not in engine._history_seq
+        assert engine._history_at(engine._bund_yield_history, 1) == pytest.approx(5.09)
+        assert engine._history_at(engine._bund_yield_history, 4) == 0.0
+
+        signal = engine.compute_fragmentation_signal(
+            btp_yield=4.0,
+            bund_yield=5.20,
+            vix_level=20.0,
+            stress_score=0.3,
+            as_of=start + timedelta(days=310),
+        )
+        assert signal.bund_yield_change_5d == pytest.approx(520.0)
+        assert signal.bund_yield_mom_20d == pytest.approx(29.0)
+
+    def test_running_spread_z_matches_window(self):
+        """Running z-score sums agree with a direct trailing-window mean/std."""
+        engine = SovereignRatesShortEngine()
+        rng = np.random.default_rng(7)
+        start = date(2024, 1, 1)
+        spreads = {}
+
+        for i in range(400):
+            day = start + timedelta(days=i)
+            btp = 4.0 + rng.normal(0, 0.1)
+            engine.update_yield_history(btp, 2.5, day)
+            spreads[day] = (btp - 2.5) * 100
+            if i % 7 == 0:
+                # Revise an earlier date inside the window
+                past = start + timedelta(days=i // 2)
+                if past in engine._history_seq:
+                    engine.update_yield_history(4.5, 2.5, past)
+                    spreads[past] = 200.0
+
+        signal = engine.compute_fragmentation_signal(4.2, 2.5, 20.0, 0.3, start + timedelta(days=400))
+        window = pd.Series(list(spreads.values()) + [170.0]).iloc[-252:]
+        expected = (170.0 - window.mean()) / window.std()
+        assert signal.spread_z == pytest.approx(expected, rel=1e-9)
+
+    def test_batch_matches_daily_signals(self):
+        """Batch signals equal the per-day path fed one date at a time."""
+        config = SovereignRatesShortConfig(spread_z_lookback_days=40)
+        rng = np.random.default_rng(11)
+        btp = 4.0 + np.cumsum(rng.normal(0, 0.05, 120))
+        bund = 2.5 + np.cumsum(rng.normal(0, 0.03, 120))
+        btp[50] = np.nan
+        vix = rng.uniform(10, 60, 120)
+
+        batch = SovereignRatesShortEngine(config=config).compute_fragmentation_signal_batch(
+            btp, bund, vix, 0.3
+        )
+
+        engine = SovereignRatesShortEngine(config=config)
+        for i in range(120):
+            signal = engine.compute_fragmentation_signal(
+                btp[i], bund[i], vix[i], 0.3, date(2024, 1, 1) + timedelta(days=i)
+            )
+            row = batch[i]
+            for name in row.dtype.names:
+                np.testing.assert_allclose(
+                    row[name], getattr(signal, name), rtol=1e-9, atol=1e-9, err_msg=name
+                )
+
+    def test_flat_spread_has_zero_z(self):
+        """A constant spread has zero variance and therefore zero z-score."""
+        engine = SovereignRatesShortEngine()
+        for i in range(60):
+            signal = engine.compute_fragmentation_signal(
+                4.1, 2.3, 20.0, 0.3, date(2024, 1, 1) + timedelta(days=i)
+            )
+        assert signal.spread_z == 0.0
+
     def test_deflation_guard_triggers(self):
         """Test deflation guard conditions."""
         engine = SovereignRatesShortEngine()
@@ -179,6 +265,34 @@ class TestSizingRules:
         result_very_high = engine.compute_target_weight(signal_very_high_z, RiskRegime.NORMAL, 1000000)
         assert result_very_high.frag_multiplier == 1.6
 
+    def test_deflation_scaler_batch_matches_scalar(self):
+        """Batch tier classification picks the same tier as the scalar ladder."""
+        # Tier 1 VIX threshold above tier 2's: tiers are not nested
+        config = SovereignRatesShortConfig(deflation_tier1_vix=50.0)
+        engine = SovereignRatesShortEngine(config=config)
+        rng = np.random.default_rng(5)
+
+        signals = np.zeros(500, dtype=SIGNAL_BATCH_DTYPE).view(np.recarray)
+        signals.vix_level = rng.uniform(20, 70, 500)
+        signals.bund_yield_change_5d = rng.uniform(-80, 10, 500)
+        signals.spread_z = rng.uniform(-2, 1, 500)
+
+        batch = engine.compute_deflation_scaler_batch(signals)
+
+        for row, scaler in zip(signals, batch):
+            signal = FragmentationSignal(
+                spread_bps=200.0,
+                spread_z=row.spread_z,
+                spread_mom_20d=0.0,
+                bund_yield_mom_60d=0.0,
+                bund_yield_change_5d=row.bund_yield_change_5d,
+                bund_yield_mom_20d=0.0,
+                vix_level=row.vix_level,
+                stress_score=0.5,
+            )
+            assert scaler == engine._compute_deflation_scaler(signal)[0]
+        assert set(batch) == {1.0, 0.5, 0.25, 0.0}
+
     def test_deflation_guard_zeroes_weight(self):
         """Test that deflation guard sets target weight to zero."""
         engine = SovereignRatesShortEngine()
@@ -278,6 +392,56 @@ class TestKillSwitches:
         base_without_soft_kill = result.base_weight * result.frag_multiplier * result.rates_multiplier
         assert result.target_weight < base_without_soft_kill
 
+    def test_soft_kill_reason(self):
+        """The sizing reason lists each multiplier and the kill applied."""
+        engine = SovereignRatesShortEngine()
+        signal = FragmentationSignal(
+            spread_bps=200.0,
+            spread_z=-0.7,
+            spread_mom_20d=0.0,
+            bund_yield_mom_60d=50.0,
+            bund_yield_change_5d=-45.0,
+            bund_yield_mom_20d=0.0,
+            vix_level=50.0,
+            stress_score=0.9,
+        )
+
+        result = engine.compute_target_weight(signal, RiskRegime.CRISIS, 1000000)
+
+        assert result.reason == (
+            "regime=crisis; base=16.00%; frag_mult=0.5 (z=-0.70); "
+            "rates_mult=1.2 (bund_60d=50bps); "
+            "defl_scaler=0.25 (tier2 (VIX=50, bund_5d=-45bps)); SOFT_KILL (-50%)"
+        )
+
+    def test_rolling_10d_pnl_window(self):
+        """Only the last 10 daily P&Ls count toward the drawdown kill."""
+        engine = SovereignRatesShortEngine()
+        tracker = engine._tracker
+
+        pnls = [-20_000.0] * 3 + [1_000.0 * i for i in range(12)]
+        for pnl in pnls:
+            tracker.update_daily_pnl(pnl)
+
+        assert list(tracker.daily_pnl_history) == pnls[-10:]
+        assert tracker.rolling_10d_pnl == pytest.approx(sum(pnls[-10:]))
+        assert tracker.cumulative_pnl == pytest.approx(sum(pnls))
+
+        # -20k/day for 10 days is a 2% drawdown on 10mm NAV -> hard kill
+        for _ in range(10):
+            tracker.update_daily_pnl(-20_000.0)
+        signal = FragmentationSignal(
+            spread_bps=200.0,
+            spread_z=0.5,
+            spread_mom_20d=0.0,
+            bund_yield_mom_60d=20.0,
+            bund_yield_change_5d=0.0,
+            bund_yield_mom_20d=0.0,
+            vix_level=18.0,
+            stress_score=0.2,
+        )
+        assert engine._check_kill_switches(signal, 10_000_000, 0.0) == KillSwitchType.HARD
+
 
 class TestTakeProfit:
     """Tests for take-profit rules."""
@@ -346,6 +510,62 @@ class TestConfigFromSettings:
         assert config.btp_symbol == "FBTP"
         assert config.bund_symbol == "FGBL"
 
+    def test_regime_weights(self):
+        """Regime weights fall back to defaults and follow reassigned dicts."""
+        config = SovereignRatesShortConfig()
+
+        assert config.regime_weights(RiskRegime.CRISIS) == (0.16, 0.20)
+        assert config.regime_weights(RiskRegime.RECOVERY) == (0.10, 0.12)
+
+        config.base_weights = {"crisis": 0.18}
+        assert config.regime_weights(RiskRegime.CRISIS) == (0.18, 0.20)
+        assert config.regime_weights(RiskRegime.NORMAL) == (0.10, 0.10)
+
+    def test_regime_weights_follow_in_place_edits(self):
+        """Editing the weight dicts in place changes the next sizing."""
+        engine = SovereignRatesShortEngine()
+        signal = FragmentationSignal(
+            spread_bps=200.0,
+            spread_z=0.5,
+            spread_mom_20d=10.0,
+            bund_yield_mom_60d=20.0,
+            bund_yield_change_5d=5.0,
+            bund_yield_mom_20d=10.0,
+            vix_level=18.0,
+            stress_score=0.2,
+        )
+
+        result = engine.compute_target_weight(signal, RiskRegime.NORMAL, 1000000)
+        assert result.base_weight == 0.06
+
+        engine.config.base_weights['normal'] = 0.02
+        result = engine.compute_target_weight(signal, RiskRegime.NORMAL, 1000000)
+        assert result.base_weight == 0.02
+
+    def test_default_dicts_not_shared(self):
+        """Configs get their own copies of the default dict fields."""
+        settings = {'sovereign_rates_short': {'enabled': True}}
+        first = SovereignRatesShortConfig.from_settings(settings)
+        second = SovereignRatesShortConfig.from_settings(settings)
+
+        assert first.base_weights == {'normal': 0.06, 'elevated': 0.12, 'crisis': 0.16}
+        assert first.dv01_per_contract == SovereignRatesShortConfig().dv01_per_contract
+        first.base_weights['normal'] = 0.01
+        assert second.base_weights['normal'] == 0.06
+        assert SovereignRatesShortConfig().base_weights['normal'] == 0.06
+
+    def test_contract_dv01_follows_in_place_recalibration(self):
+        """Recalibrating dv01_per_contract in place changes the next sizing."""
+        engine = SovereignRatesShortEngine()
+        position = engine.compute_dv01_position(0.10, 1000000)
+        assert position.dv01_per_btp == 78.0
+        assert position.dv01_per_bund == 80.0
+
+        engine.config.dv01_per_contract['FBTP'] = 150.0
+        position = engine.compute_dv01_position(0.10, 1000000)
+        assert position.dv01_per_btp == 150.0
+        assert position.btp_contracts == -round(0.10 * 1000000 * 0.0007 / 150.0)
+
     def test_config_from_settings(self):
         """Test configuration loading from settings dict."""
         settings = {